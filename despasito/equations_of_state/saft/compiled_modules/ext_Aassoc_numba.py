@@ -79,7 +79,7 @@ def calc_Xika(indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_asso
 #        numba.f8[:, :, :],
 #    )
 # )
-@numba.njit()
+@numba.njit(cache=True)
 def calc_Xika_4(
     indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc
 ):  # , maxiter=500, tol=1e-12, damp=.1
@@ -188,7 +188,7 @@ def calc_Xika_4(
 #        numba.f8[:, :, :],
 #    )
 # )
-@numba.njit()
+@numba.njit(cache=True)
 def calc_Xika_6(
     indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc
 ):  # , maxiter=500, tol=1e-12, damp=.1
@@ -17,7 +17,7 @@ ckl_coef = np.array(
 # from profilehooks import profile
 
 
-@numba.njit(numba.f8[:](numba.f8[:], numba.f8[:]))
+@numba.njit(numba.f8[:](numba.f8[:], numba.f8[:]), cache=True)
 def prefactor_1d(l_r, l_a):
     r"""
     Calculations C, the Mie potential prefactor, defined in eq. 2
@@ -48,7 +48,8 @@ def prefactor_1d(l_r, l_a):
         numba.f8[:],
         numba.f8[:, :],
         numba.f8[:, :],
-    )
+    ),
+    cache=True,
 )
 def calc_a1s(rho, Cmol2seg, l_kl, zetax, epsilonkl, dkl):
     r"""
@@ -129,7 +130,8 @@ def calc_a1s(rho, Cmol2seg, l_kl, zetax, epsilonkl, dkl):
         numba.f8[:, :],
         numba.f8[:, :],
         numba.f8[:],
-    )
+    ),
+    cache=True,
 )
 def calc_Bkl(rho, l_kl, Cmol2seg, dkl, epsilonkl, x0kl, zetax):
     r"""
@@ -202,7 +204,8 @@ def calc_Bkl(rho, l_kl, Cmol2seg, dkl, epsilonkl, x0kl, zetax):
         numba.f8[:, :],
         numba.f8[:, :],
         numba.f8[:],
-    )
+    ),
+    cache=True,
 )
 def calc_a1ii(rho, Cmol2seg, dkl, l_akl, l_rkl, x0kl, epsilonkl, zetax):
     r"""
@@ -257,7 +260,8 @@ def calc_a1ii(rho, Cmol2seg, dkl, l_akl, l_rkl, x0kl, epsilonkl, zetax):
 @numba.njit(
     numba.f8[:, :](
         numba.f8[:], numba.f8, numba.f8[:], numba.f8[:], numba.f8[:], numba.f8[:]
-    )
+    ),
+    cache=True,
 )
 def calc_a1s_eff(rho, Cmol2seg, l_ii_avg, zetax, epsilonii_avg, dii_avg):
     r"""
@@ -339,7 +343,8 @@ def calc_a1s_eff(rho, Cmol2seg, l_ii_avg, zetax, epsilonii_avg, dii_avg):
         numba.f8[:],
         numba.f8[:],
         numba.f8[:],
-    )
+    ),
+    cache=True,
 )
 def calc_Bkl_eff(rho, l_ii_avg, Cmol2seg, dii_avg, epsilonii_avg, x0ii, zetax):
     r"""
@@ -401,7 +406,8 @@ def calc_Bkl_eff(rho, l_ii_avg, Cmol2seg, dii_avg, epsilonii_avg, x0ii, zetax):
 @numba.njit(
     numba.f8[:, :](
         numba.f8[:], numba.f8, numba.f8[:], numba.f8[:], numba.f8[:], numba.f8[:]
-    )
+    ),
+    cache=True,
 )
 def calc_da1sii_drhos(rho, Cmol2seg, l_ii_avg, zetax, epsilonii_avg, dii_avg):
     r"""
@@ -481,7 +487,8 @@ def calc_da1sii_drhos(rho, Cmol2seg, l_ii_avg, zetax, epsilonii_avg, dii_avg):
 
 
 @numba.njit(
-    numba.f8[:, :](numba.f8[:], numba.f8[:], numba.f8[:], numba.f8[:], numba.f8[:])
+    numba.f8[:, :](numba.f8[:], numba.f8[:], numba.f8[:], numba.f8[:], numba.f8[:]),
+    cache=True,
 )
 def calc_dBkl_drhos(l_ii_avg, dii_avg, epsilonii_avg, x0ii, zetax):
     r"""
@@ -555,7 +562,8 @@ def calc_dBkl_drhos(l_ii_avg, dii_avg, epsilonii_avg, x0ii, zetax):
         numba.f8[:],
         numba.f8[:],
         numba.f8[:],
-    )
+    ),
+    cache=True,
 )
 def calc_da1iidrhos(
     rho, Cmol2seg, dii_eff, l_aii_avg, l_rii_avg, x0ii, epsilonii_avg, zetax
@@ -625,7 +633,8 @@ def calc_da1iidrhos(
         numba.f8[:],
         numba.f8[:],
         numba.f8[:],
-    )
+    ),
+    cache=True,
 )
 def calc_da2ii_1pchi_drhos(
     rho, Cmol2seg, epsilonii_avg, dii_eff, x0ii, l_rii_avg, l_aii_avg, zetax
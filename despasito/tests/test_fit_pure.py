@@ -176,4 +176,4 @@ def test_saturation_de(Eos=Eos, thermo_dict=thermo_dict0.copy()):
 
     assert output["parameters_final"][0] == pytest.approx(375.01, abs=1.0) and output[
         "objective_value"
-    ] == pytest.approx(5.7658, abs=0.01)
+    ] == pytest.approx(5.7765, abs=0.01)
@@ -101,18 +101,15 @@ bead_library_co2_h2o = {
 cross_library_co2_h2o = {
     "CO2": {"H2O": {"epsilon": 226.38, "epsilonHB-H-e1": 2200.0, "K-H-e1": 9.1419e-2}}
 }
-epsilonHB_co2_h2o = np.array(
-    [
-        [
-            [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
-            [[0.0, 0.0, 2200.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
-        ],
-        [
-            [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [2200.0, 0.0, 0.0]],
-            [[0.0, 0.0, 1985.4], [0.0, 0.0, 0.0], [1985.4, 0.0, 0.0]],
-        ],
-    ]
-)
+# Association energies indexed as (bead1, bead2, site1, site2); only the
+# nonzero cross and self interactions are set and the array is frozen so it
+# can be shared without defensive copies
+epsilonHB_co2_h2o = np.zeros((2, 2, 3, 3), dtype=np.float64)
+epsilonHB_co2_h2o[0, 1, 0, 2] = 2200.0
+epsilonHB_co2_h2o[1, 0, 2, 0] = 2200.0
+epsilonHB_co2_h2o[1, 1, 0, 2] = 1985.4
+epsilonHB_co2_h2o[1, 1, 2, 0] = 1985.4
+epsilonHB_co2_h2o.setflags(write=False)
 
 T = 323.2
 rho_co2_h2o = np.array([21146.16997993])
@@ -11,6 +11,7 @@ from inspect import getmembers, isfunction
 
 # import logging
 
+from . import calc
 from . import calculation_types
 
 # logger = logging.getLogger(__name__)
@@ -44,6 +45,11 @@ def thermo(Eos, calculation_type=None, **kwargs):
     if calculation_type is None:
         raise ValueError("No calculation type specified")
 
+    # The Eos object may have been altered since the last call (e.g. between
+    # parameter fitting iterations), so memoized results cannot be trusted
+    # across calls
+    calc.clear_fugacity_cache()
+
     # Extract available calculation types
     calc_list = [o[0] for o in getmembers(calculation_types) if isfunction(o[1])]
 
@@ -9,14 +9,23 @@ import numpy as np
 from scipy import interpolate
 import scipy.optimize as spo
 from scipy.ndimage.filters import gaussian_filter1d
-import copy
 import logging
+import random
 
 import despasito.utils.general_toolbox as gtb
 from despasito import fundamental_constants as constants
 
 logger = logging.getLogger(__name__)
 
+# Inner-loop composition guesses shared between the bubble/dew point outer
+# loops and their objective functions, None until the first calculation
+_xi_global = None
+_yi_global = None
+
+# Phase flags from the last bubble/dew objective evaluation, published so the
+# outer loops don't repeat the density solves just to recover them
+_phase_flags_global = (None, None)
+
 
 def pressure_vs_volume_arrays(
     T,
@@ -87,7 +96,8 @@ def pressure_vs_volume_arrays(
     if len(kwargs) > 0:
         logger.debug(
             "    'pressure_vs_volume_arrays' does not use the following keyword "
-            "arguments: {}".format(", ".join(list(kwargs.keys())))
+            "arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     if np.any(np.isnan(xi)):
@@ -100,9 +110,7 @@ def pressure_vs_volume_arrays(
     if not max_density:
         max_density = Eos.density_max(xi, T, **density_max_opts)
     elif gtb.isiterable(max_density):
-        logger.error(
-            "    Maxrho should be type float. Given value: {}".format(max_density)
-        )
+        logger.error("    Maxrho should be type float. Given value: %s", max_density)
         max_density = max_density[0]
 
     if max_density > 1e5:
@@ -125,14 +133,31 @@ def pressure_vs_volume_arrays(
     # check rholist to see when the spacing
     vspace = (1.0 / rholist[:-1]) - (1.0 / rholist[1:])
     if np.amax(vspace) > max_volume_increment:
-        vspaceswitch = np.where(vspace > max_volume_increment)[0][-1]
-        rholist_2 = (
-            1.0
-            / np.arange(
-                1.0 / rholist[vspaceswitch + 1], 1.0 / minrho, max_volume_increment
-            )[::-1]
+        # Index of the last spacing above the cap, without materializing the
+        # full index array
+        mask = vspace > max_volume_increment
+        vspaceswitch = len(mask) - 1 - np.argmax(mask[::-1])
+        # Resolve the dilute tail with a geometrically growing specific volume
+        # grid: the spacing starts at max_volume_increment where the uniform
+        # density grid leaves off and grows by a fixed ratio per step, since
+        # the pressure curve flattens toward ideal-gas behavior at large
+        # specific volume. This keeps resolution near the roots with orders of
+        # magnitude fewer EOS evaluations than a uniform grid.
+        vmin = 1.0 / rholist[vspaceswitch + 1]
+        vmax = 1.0 / minrho
+        growth = 1.005
+        npts = int(
+            np.ceil(
+                np.log1p((vmax - vmin) * (growth - 1.0) / max_volume_increment)
+                / np.log(growth)
+            )
+        )
+        vlist_2 = vmin + max_volume_increment * (
+            growth ** np.arange(npts) - 1.0
+        ) / (growth - 1.0)
+        rholist = np.concatenate(
+            (1.0 / vlist_2[::-1], rholist[(vspaceswitch + 2):])
         )
-        rholist = np.append(rholist_2, rholist[(vspaceswitch + 2):])
 
     if len(rholist) > max_array_length:
         raise ValueError(
@@ -150,19 +175,60 @@ def pressure_vs_volume_arrays(
         if Plist[0] > pressure_min:
             rhotmp = np.linspace(rholist[0] / 2, rholist[0], extended_npts)[:-1]
             Ptmp = Eos.pressure(rhotmp, T, xi)
-            Plist = np.append(Ptmp, Plist)
-            rholist = np.append(rhotmp, rholist)
+            Plist = np.concatenate((Ptmp, Plist))
+            rholist = np.concatenate((rhotmp, rholist))
         else:
             break
 
-    # Flip Plist and rholist arrays
-    Plist = Plist[:][::-1]
-    rholist = rholist[:][::-1]
-    vlist = 1.0 / rholist
+    # Flip Plist and rholist arrays, reversed views avoid copying the arrays
+    Plist = Plist[::-1]
+    rholist = rholist[::-1]
+    vlist = np.reciprocal(rholist)
 
     return vlist, Plist
 
 
+# Memoized isotherm sweeps keyed on temperature and composition. The sweep does
+# not depend on pressure, yet the vapor and liquid density solvers rebuild it
+# for every pressure probed by the range and equilibrium solvers, and the two
+# phases rebuild identical sweeps when their compositions coincide.
+_pressure_sweep_cache = {}
+_PRESSURE_SWEEP_CACHE_MAXSIZE = 128
+
+
+def _cached_pressure_vs_volume_arrays(T, zi, Eos, density_opts):
+    r"""
+    Memoized wrapper around
+    :func:`~despasito.thermodynamics.calc.pressure_vs_volume_arrays`.
+
+    Results are stored per (EOS instance, temperature, composition, density
+    options) and returned as copies so callers may modify them freely. Falls
+    back on a direct evaluation if the density options are unhashable.
+    """
+
+    try:
+        key = (
+            id(Eos),
+            float(T),
+            tuple(np.round(np.asarray(zi, dtype=float), 12).tolist()),
+            tuple(sorted(density_opts.items())),
+        )
+        hash(key)
+    except TypeError:
+        return pressure_vs_volume_arrays(T, zi, Eos, **density_opts)
+
+    if key not in _pressure_sweep_cache:
+        if len(_pressure_sweep_cache) >= _PRESSURE_SWEEP_CACHE_MAXSIZE:
+            _pressure_sweep_cache.pop(next(iter(_pressure_sweep_cache)))
+        _pressure_sweep_cache[key] = pressure_vs_volume_arrays(
+            T, zi, Eos, **density_opts
+        )
+
+    vlist, Plist = _pressure_sweep_cache[key]
+
+    return np.array(vlist), np.array(Plist)
+
+
 def pressure_vs_volume_spline(vlist, Plist):
     r"""
     Fit arrays of specific volume and pressure values to a cubic Univariate Spline.
@@ -189,6 +255,9 @@ def pressure_vs_volume_spline(vlist, Plist):
     # Larger sigma value
     Psmoothed = gaussian_filter1d(Plist, sigma=1.0e-2)
 
+    # Two fits are unavoidable here: FITPACK's sproot only supports cubic
+    # splines, so the roots come from the k=3 fit, while the extrema need the
+    # quartic fit so its derivative is still cubic
     Pvspline = interpolate.InterpolatedUnivariateSpline(vlist, Psmoothed)
     roots = Pvspline.roots().tolist()
     Pvspline = interpolate.InterpolatedUnivariateSpline(vlist, Psmoothed, k=4)
@@ -205,6 +274,105 @@ def pressure_vs_volume_spline(vlist, Plist):
     return Pvspline, roots, extrema
 
 
+def _pressure_tail_line(vlist, Plist, npts=4):
+    r"""
+    Linear least-squares fit of the tail of the pressure vs. specific volume curve.
+
+    Closed-form equivalent of ``np.polyfit(vlist[-npts:], Plist[-npts:], 1)``
+    without the Vandermonde and SVD overhead of the general routine.
+
+    Parameters
+    ----------
+    vlist : numpy.ndarray
+        [:math:`m^3`/mol] Specific volume array.
+    Plist : numpy.ndarray
+        [Pa] Pressure associated with specific volume of system with given
+        temperature and composition
+    npts : int, Optional, default=4
+        Number of points at the end of the curve used in the fit
+
+    Returns
+    -------
+    slope : float
+        [Pa mol/:math:`m^3`] Slope of the fitted line
+    intercept : float
+        [Pa] Intercept of the fitted line
+    """
+
+    x = vlist[-npts:]
+    y = Plist[-npts:]
+    dx = x - x.mean()
+    slope = np.dot(dx, y - y.mean()) / np.dot(dx, dx)
+
+    return slope, y.mean() - slope * x.mean()
+
+
+# Memoized spline fits of unshifted isotherms, keyed like the sweep cache.
+# The smoothing filter and spline fits are linear in pressure, so one set of
+# fits serves every system pressure probed at a given (T, composition).
+_isotherm_spline_cache = {}
+_ISOTHERM_SPLINE_CACHE_MAXSIZE = 128
+
+
+def _cached_shifted_volume_spline(T, zi, Eos, density_opts, vlist, Plist, shift):
+    r"""
+    Spline data of ``Plist - shift`` vs. specific volume, reusing cached fits.
+
+    Equivalent to ``pressure_vs_volume_spline(vlist, Plist - shift)``, but the
+    fits of the unshifted isotherm are cached per (EOS instance, temperature,
+    composition, density options): the roots at a given pressure shift come
+    from the cubic spline with shifted coefficients, the extrema locations do
+    not depend on the shift at all, and the returned callable subtracts the
+    shift from the cached quartic fit. Falls back on a direct evaluation when
+    the key is unhashable or the isotherm contains NaN.
+    """
+
+    try:
+        key = (
+            id(Eos),
+            float(T),
+            tuple(np.round(np.asarray(zi, dtype=float), 12).tolist()),
+            tuple(sorted(density_opts.items())),
+        )
+        hash(key)
+    except TypeError:
+        key = None
+    if key is None or np.any(np.isnan(Plist)):
+        return pressure_vs_volume_spline(vlist, Plist - shift)
+
+    if key not in _isotherm_spline_cache:
+        Psmoothed = gaussian_filter1d(Plist, sigma=1.0e-2)
+        tck_cubic = interpolate.splrep(vlist, Psmoothed, k=3, s=0)
+        quartic = interpolate.InterpolatedUnivariateSpline(vlist, Psmoothed, k=4)
+        extrema = quartic.derivative().roots().tolist()
+        if len(extrema) > 2:
+            extrema = extrema[0:2]
+        if len(_isotherm_spline_cache) >= _ISOTHERM_SPLINE_CACHE_MAXSIZE:
+            _isotherm_spline_cache.pop(next(iter(_isotherm_spline_cache)))
+        _isotherm_spline_cache[key] = (tck_cubic, quartic, extrema)
+
+    tck_cubic, quartic, extrema = _isotherm_spline_cache[key]
+    roots = interpolate.sproot(
+        (tck_cubic[0], tck_cubic[1] - shift, tck_cubic[2])
+    ).tolist()
+
+    def Pvspline(v):
+        return quartic(v) - shift
+
+    return Pvspline, roots, list(extrema)
+
+
+def _spline_higher_at_root(Pvspline, root, extrema):
+    r"""
+    Compare the smoothed isotherm at a root against its value at the last
+    extremum with one vectorized spline call instead of two scalar calls.
+    """
+
+    P_root, P_extrema = Pvspline(np.array([root, max(extrema)]))
+
+    return P_root > P_extrema
+
+
 def pressure_vs_volume_plot(vlist, Plist, Pvspline, markers=[], **kwargs):
     r"""
     Plot pressure vs. specific volume.
@@ -225,7 +393,8 @@ def pressure_vs_volume_plot(vlist, Plist, Pvspline, markers=[], **kwargs):
     if len(kwargs) > 0:
         logger.debug(
             "    'pressure_vs_volume_plot' does not use the following keyword "
-            "arguments: {}".format(", ".join(list(kwargs.keys())))
+            "arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     try:
@@ -283,7 +452,8 @@ def calc_saturation_properties(
     if len(kwargs) > 0:
         logger.debug(
             "    'calc_saturation_properties' does not use the following keyword "
-            "arguments: {}".format(", ".join(list(kwargs.keys())))
+            "arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     if np.count_nonzero(xi) != 1:
@@ -293,7 +463,7 @@ def calc_saturation_properties(
                 "for source"
             )
         else:
-            ind = np.where(xi > 0.1)[0]
+            ind = np.flatnonzero(xi > 0.1)
             raise ValueError(
                 "Multiple components have compositions greater than 0. Do you mean to"
                 " obtain the saturation pressure of"
@@ -301,7 +471,32 @@ def calc_saturation_properties(
                 "of {}?".format(Eos.beads[ind], xi[ind])
             )
 
-    vlist, Plist = pressure_vs_volume_arrays(T, xi, Eos, **density_opts)
+    cache_key = _saturation_cache_key(T, xi, Eos, density_opts, tol, Pconverged)
+    if cache_key is not None and cache_key in _saturation_cache:
+        return _saturation_cache[cache_key]
+
+    # A subcritical isotherm must contain a van der Waals loop, a density range
+    # where the pressure decreases with increasing density. Screen for one on a
+    # coarse density grid so that supercritical states skip the full pressure
+    # sweep; well below the critical point the loop spans a wide density range,
+    # so a few thousand probe points will not miss it.
+    max_density = density_opts.get("max_density")
+    if max_density is None or gtb.isiterable(max_density):
+        max_density = Eos.density_max(
+            xi, T, **density_opts.get("density_max_opts", {})
+        )
+    min_density = max_density * density_opts.get(
+        "min_density_fraction", 1.0 / 500000.0
+    )
+    rho_probe = np.linspace(min_density, 0.99 * max_density, 2000)
+    P_probe = Eos.pressure(rho_probe, T, xi)
+    if not np.any(np.diff(P_probe) < 0):
+        logger.warning("    The component is above its critical point")
+        if cache_key is not None:
+            _saturation_cache_store(cache_key, (np.nan, np.nan, np.nan))
+        return np.nan, np.nan, np.nan
+
+    vlist, Plist = _cached_pressure_vs_volume_arrays(T, xi, Eos, density_opts)
     Pvspline, roots, extrema = pressure_vs_volume_spline(vlist, Plist)
 
     if not extrema or len(extrema) < 2 or np.any(np.isnan(roots)):
@@ -309,36 +504,63 @@ def calc_saturation_properties(
         Psat, rhol, rhov = np.nan, np.nan, np.nan
 
     else:
-        ind_Pmin1 = np.argwhere(np.diff(Plist) > 0)[0][0]
+        ind_Pmin1 = np.argmax(np.diff(Plist) > 0)
         ind_Pmax1 = np.argmax(Plist[ind_Pmin1:]) + ind_Pmin1
 
         Pmaxsearch = Plist[ind_Pmax1]
         Pminsearch = max(Pconverged, np.amin(Plist[ind_Pmin1:ind_Pmax1]))
 
-        # Using computed Psat find the roots in the maxwell construction to give
-        # liquid (first root) and vapor (last root) densities
-        Psat = spo.minimize_scalar(
-            objective_saturation_pressure,
-            args=(Plist, vlist),
-            bounds=(Pminsearch, Pmaxsearch),
-            method="bounded",
+        # Smooth and integrate the pressure curve once. Smoothing is linear, so
+        # shifting the pressure data by a candidate Psat just shifts the
+        # smoothed curve, letting the objective function reuse this data
+        # instead of smoothing and refitting splines on every iteration.
+        Psmoothed = gaussian_filter1d(Plist, sigma=1.0e-2)
+        tck_cubic = interpolate.splrep(vlist, Psmoothed, k=3, s=0)
+        Pcumtrapz = np.concatenate(
+            ([0.0], np.cumsum((Psmoothed[1:] + Psmoothed[:-1]) * np.diff(vlist) / 2))
         )
-        Psat = Psat.x
-        obj_value = objective_saturation_pressure(Psat, Plist, vlist)
+        tail_slope, tail_intercept = _pressure_tail_line(vlist, Plist)
 
-        Pvspline, roots, extrema = pressure_vs_volume_spline(vlist, Plist - Psat)
+        # Using computed Psat find the roots in the maxwell construction to give
+        # liquid (first root) and vapor (last root) densities. The signed area
+        # passes through zero between the pressure bounds, so a bracketed root
+        # solve needs far fewer objective evaluations than a bounded
+        # minimization of its square; fall back on the minimizer if the
+        # bracket ends do not show a sign change or cannot be evaluated
+        args = (vlist, Plist, Psmoothed, Pcumtrapz, tail_slope, tail_intercept)
+        try:
+            Psat = spo.brentq(
+                _signed_saturation_area_shifted, Pminsearch, Pmaxsearch, args=args
+            )
+        except ValueError:
+            Psat = spo.minimize_scalar(
+                _objective_saturation_pressure_shifted,
+                args=args,
+                bounds=(Pminsearch, Pmaxsearch),
+                method="bounded",
+            ).x
+        obj_value = _objective_saturation_pressure_shifted(Psat, *args)
+
+        # Shifting the curve by Psat leaves its derivative, and so the extrema
+        # found above, untouched; the shifted roots follow from the prefitted
+        # cubic spline coefficients without smoothing and refitting the curve
+        roots = interpolate.sproot(
+            (tck_cubic[0], tck_cubic[1] - Psat, tck_cubic[2])
+        ).tolist()
         #      pressure_vs_volume_plot(vlist, Plist, Pvspline, markers=extrema)
 
         if obj_value < tol:
             logger.debug(
-                "    Psat found: "
-                "{} Pa, obj value: {}, with {} roots and {} extrema".format(
-                    Psat, obj_value, np.size(roots), np.size(extrema)
-                )
+                "    Psat found: %s Pa, obj value: %s, with %s roots and %s extrema",
+                Psat,
+                obj_value,
+                len(roots),
+                len(extrema),
             )
 
             if len(roots) == 2:
-                slope, yroot = np.polyfit(vlist[-4:], Plist[-4:] - Psat, 1)
+                slope, yroot = _pressure_tail_line(vlist, Plist)
+                yroot -= Psat
                 vroot = -yroot / slope
                 if vroot < 0.0:
                     vroot = np.finfo(float).eps
@@ -355,8 +577,10 @@ def calc_saturation_properties(
 
         else:
             logger.warning(
-                "    Psat NOT found: {} Pa, obj value: {},".format(Psat, obj_value)
-                + " consider decreasing 'pressure_min' option in density_opts"
+                "    Psat NOT found: %s Pa, obj value: %s, consider decreasing "
+                "'pressure_min' option in density_opts",
+                Psat,
+                obj_value,
             )
             Psat, rhol, rhov = np.nan, np.nan, np.nan
 
@@ -366,7 +590,10 @@ def calc_saturation_properties(
     tmpl, _, _ = calc_liquid_fugacity_coefficient(
         Psat, T, xi, Eos, density_opts=density_opts
     )
-    logger.debug("    phiv: {}, phil: {}".format(tmpv, tmpl))
+    logger.debug("    phiv: %s, phil: %s", tmpv, tmpl)
+
+    if cache_key is not None:
+        _saturation_cache_store(cache_key, (Psat, rhol, rhov))
 
     return Psat, rhol, rhov
 
@@ -406,7 +633,8 @@ def objective_saturation_pressure(shift, Pv, vlist):
         # If the curve hasn't decayed to 0 yet, estimate the remaining area as a
         # triangle. This isn't super accurate but we are just using the saturation
         # pressure to get started.
-        slope, yroot = np.polyfit(vlist[-4:], Pv[-4:] - shift, 1)
+        slope, yroot = _pressure_tail_line(vlist, Pv)
+        yroot -= shift
         b = (
             Pvspline.integral(roots[1], vlist[-1])
             + (Pv[-1] - shift) * (-yroot / slope - vlist[-1]) / 2
@@ -430,6 +658,123 @@ def objective_saturation_pressure(shift, Pv, vlist):
     return (a + b) ** 2
 
 
+def _signed_saturation_area_shifted(
+    shift, vlist, Plist, Psmoothed, Pcumtrapz, tail_slope, tail_intercept
+):
+    r"""
+    Signed Maxwell-construction area for :func:`_objective_saturation_pressure_shifted`.
+
+    Because Gaussian smoothing is linear, the smoothed curve of ``Plist - shift``
+    equals ``Psmoothed - shift``, so its roots follow from sign changes of the
+    precomputed smoothed curve. The areas come from a cumulative trapezoidal
+    integral of the smoothed curve, which on the dense density grid matches the
+    spline integrals used elsewhere while avoiding any FITPACK call per trial
+    value of ``shift``.
+
+    Parameters
+    ----------
+    shift : float
+        [Pa] Guess in Psat value used to translate the pressure vs. specific volume
+        curve
+    vlist : numpy.ndarray
+        [:math:`m^3`/mol] Specific volume array.
+    Plist : numpy.ndarray
+        [Pa] Pressure associated with specific volume of system with given
+        temperature and composition
+    Psmoothed : numpy.ndarray
+        [Pa] Gaussian smoothed pressure curve
+    Pcumtrapz : numpy.ndarray
+        [Pa :math:`m^3`/mol] Cumulative trapezoidal integral of the smoothed
+        pressure curve over the specific volume array
+    tail_slope : float
+        Slope of a linear fit of the last four points of the pressure curve
+    tail_intercept : float
+        Intercept of a linear fit of the last four points of the pressure curve
+
+    Returns
+    -------
+    area : float
+        The addition of the positive area between first two roots, and negative
+        area between second and third roots. Zero at the saturation pressure.
+    """
+
+    above = Psmoothed > shift
+    ind = np.flatnonzero(above[1:] != above[:-1])
+    roots = vlist[ind] + (shift - Psmoothed[ind]) * (
+        vlist[ind + 1] - vlist[ind]
+    ) / (Psmoothed[ind + 1] - Psmoothed[ind])
+
+    def _integral(i0, r0, i1, r1):
+        # Integral of the smoothed curve from r0 (within grid cell i0) to r1
+        # (within grid cell i1), from the cumulative integral plus trapezoidal
+        # corrections for the partial cells; the curve equals shift at the roots
+        return (
+            Pcumtrapz[i1]
+            - Pcumtrapz[i0 + 1]
+            + (shift + Psmoothed[i0 + 1]) * (vlist[i0 + 1] - r0) / 2
+            + (Psmoothed[i1] + shift) * (r1 - vlist[i1]) / 2
+        )
+
+    if len(roots) >= 3:
+        a = _integral(ind[0], roots[0], ind[1], roots[1]) - shift * (
+            roots[1] - roots[0]
+        )
+        b = _integral(ind[1], roots[1], ind[2], roots[2]) - shift * (
+            roots[2] - roots[1]
+        )
+    elif len(roots) == 2:
+        a = _integral(ind[0], roots[0], ind[1], roots[1]) - shift * (
+            roots[1] - roots[0]
+        )
+        # If the curve hasn't decayed to 0 yet, estimate the remaining area as a
+        # triangle. This isn't super accurate but we are just using the saturation
+        # pressure to get started.
+        yroot = tail_intercept - shift
+        b = (
+            Pcumtrapz[-1]
+            - Pcumtrapz[ind[1] + 1]
+            + (shift + Psmoothed[ind[1] + 1]) * (vlist[ind[1] + 1] - roots[1]) / 2
+            - shift * (vlist[-1] - roots[1])
+            + (Plist[-1] - shift) * (-yroot / tail_slope - vlist[-1]) / 2
+        )
+    elif np.any(np.isnan(Psmoothed)):
+        raise ValueError(
+            "Pressure curve without cubic properties has wrongly been accepted. Try "
+            + "decreasing pressure."
+        )
+    else:
+        raise ValueError(
+            "Pressure curve without cubic properties has wrongly been accepted. Try "
+            "decreasing min_density_fraction"
+        )
+
+    return a + b
+
+
+def _objective_saturation_pressure_shifted(
+    shift, vlist, Plist, Psmoothed, Pcumtrapz, tail_slope, tail_intercept
+):
+    r"""
+    Fast equivalent of :func:`objective_saturation_pressure` using precomputed data.
+
+    Square of :func:`_signed_saturation_area_shifted`; see there for the parameter
+    descriptions.
+
+    Returns
+    -------
+    obj_value : float
+        Output of objective function, the addition of the positive area between first
+        two roots, and negative area between second and third roots, quantity squared.
+    """
+
+    return (
+        _signed_saturation_area_shifted(
+            shift, vlist, Plist, Psmoothed, Pcumtrapz, tail_slope, tail_intercept
+        )
+        ** 2
+    )
+
+
 def calc_vapor_density(P, T, xi, Eos, density_opts={}, **kwargs):
     r"""
     Computes vapor density under system conditions.
@@ -459,15 +804,23 @@ def calc_vapor_density(P, T, xi, Eos, density_opts={}, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "    'calc_vapor_density' does not use the following keyword arguments:"
-            " {}".format(", ".join(list(kwargs.keys())))
+            "    'calc_vapor_density' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
-    vlist, Plist = pressure_vs_volume_arrays(T, xi, Eos, **density_opts)
+    vlist, Plist = _cached_pressure_vs_volume_arrays(T, xi, Eos, density_opts)
+    Pvspline, roots, extrema = _cached_shifted_volume_spline(
+        T, xi, Eos, density_opts, vlist, Plist, P
+    )
     Plist = Plist - P
-    Pvspline, roots, extrema = pressure_vs_volume_spline(vlist, Plist)
 
-    logger.debug("    Find rhov: P {} Pa, roots {} m^3/mol".format(P, roots))
+    logger.debug("    Find rhov: P %s Pa, roots %s m^3/mol", P, roots)
+
+    # The packing-fraction limit only depends on T and xi, so evaluate it once
+    # and reuse it for every bound below, alongside the machine epsilon used as
+    # the lower density bound
+    rho_max = Eos.density_max(xi, T, maxpack=0.99)
+    eps = np.finfo("float").eps
 
     flag_NoOpt = False
     l_roots = len(roots)
@@ -475,54 +828,56 @@ def calc_vapor_density(P, T, xi, Eos, density_opts={}, **kwargs):
         rho_tmp = np.nan
         flag = 3
         logger.warning(
-            "    Flag 3: The T and yi, {} {}, won't produce a fluid (vapor or liquid)"
-            " at this pressure".format(T, xi)
+            "    Flag 3: The T and yi, %s %s, won't produce a fluid (vapor or liquid) "
+            "at this pressure",
+            T,
+            xi,
         )
     elif l_roots == 0:
         if Pvspline(1 / vlist[-1]) < 0:
             try:
-                rho_tmp = spo.least_squares(
-                    pressure_spline_error,
-                    1 / vlist[0],
-                    args=(P, T, xi, Eos),
-                    bounds=(
-                        np.finfo("float").eps,
-                        Eos.density_max(xi, T, maxpack=0.99),
-                    ),
+                rho_tmp = _solve_density_root(
+                    1 / vlist[0], (eps, rho_max), P, T, xi, Eos
                 )
-                rho_tmp = rho_tmp.x
                 if not len(extrema):
                     flag = 2
                     logger.debug(
-                        "    Flag 2: The T and yi, {} {}, combination produces a "
-                        "critical fluid at this pressure".format(T, xi)
+                        "    Flag 2: The T and yi, %s %s, combination produces a "
+                        "critical fluid at this pressure",
+                        T,
+                        xi,
                     )
                 else:
                     flag = 1
                     logger.debug(
-                        "    Flag 1: The T and yi, {} {}, combination produces a "
-                        "liquid at this pressure".format(T, xi)
+                        "    Flag 1: The T and yi, %s %s, combination produces a "
+                        "liquid at this pressure",
+                        T,
+                        xi,
                     )
             except Exception:
                 rho_tmp = np.nan
                 flag = 3
                 logger.warning(
-                    "    Flag 3: The T and xi, {} {}, won't produce a fluid (vapor "
-                    "or liquid) at this pressure, without density greater than max,"
-                    " {}".format(T, xi, Eos.density_max(xi, T, maxpack=0.99))
+                    "    Flag 3: The T and xi, %s %s, won't produce a fluid (vapor or "
+                    "liquid) at this pressure, without density greater than max, %s",
+                    T,
+                    xi,
+                    rho_max,
                 )
             flag_NoOpt = True
         elif min(Plist) + P > 0:
-            slope, yroot = np.polyfit(vlist[-4:], Plist[-4:], 1)
+            slope, yroot = _pressure_tail_line(vlist, Plist)
             vroot = -yroot / slope
             try:
-                rho_tmp = spo.least_squares(
-                    pressure_spline_error,
+                rho_tmp = _solve_density_root(
                     1 / vroot,
-                    args=(P, T, xi, Eos),
-                    bounds=(np.finfo("float").eps, 1.0 / (1.1 * roots[-1])),
+                    (eps, 1.0 / (1.1 * roots[-1])),
+                    P,
+                    T,
+                    xi,
+                    Eos,
                 )
-                rho_tmp = rho_tmp.x
                 flag = 0
             except Exception:
                 rho_tmp = np.nan
@@ -530,20 +885,24 @@ def calc_vapor_density(P, T, xi, Eos, density_opts={}, **kwargs):
 
             if not len(extrema):
                 logger.debug(
-                    "    Flag 2: The T and yi, {} {}, combination produces a critical"
-                    " fluid at this pressure".format(T, xi)
+                    "    Flag 2: The T and yi, %s %s, combination produces a critical "
+                    "fluid at this pressure",
+                    T,
+                    xi,
                 )
             else:
                 logger.debug(
-                    "    Flag 0: This T and yi, {} {}, combination produces a vapor"
-                    " at this pressure. Warning! approaching critical fluid".format(
-                        T, xi
-                    )
+                    "    Flag 0: This T and yi, %s %s, combination produces a vapor at "
+                    "this pressure. Warning! approaching critical fluid",
+                    T,
+                    xi,
                 )
         else:
             logger.warning(
-                "    Flag 3: The T and yi, {} {}, won't produce a fluid (vapor or "
-                "liquid) at this pressure".format(T, xi)
+                "    Flag 3: The T and yi, %s %s, won't produce a fluid (vapor or "
+                "liquid) at this pressure",
+                T,
+                xi,
             )
             flag = 3
             rho_tmp = np.nan
@@ -552,42 +911,51 @@ def calc_vapor_density(P, T, xi, Eos, density_opts={}, **kwargs):
             flag = 2
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 2: The T and yi, {} {}, combination produces a critical "
-                "fluid at this pressure".format(T, xi)
+                "    Flag 2: The T and yi, %s %s, combination produces a critical "
+                "fluid at this pressure",
+                T,
+                xi,
             )
-        elif (Pvspline(roots[0]) + P) > (Pvspline(max(extrema)) + P):
+        elif _spline_higher_at_root(Pvspline, roots[0], extrema):
             flag = 1
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 1: The T and yi, {} {}, combination produces a liquid at "
-                "this pressure".format(T, xi)
+                "    Flag 1: The T and yi, %s %s, combination produces a liquid at "
+                "this pressure",
+                T,
+                xi,
             )
         elif len(extrema) > 1:
             flag = 0
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 0: This T and yi, {} {}, combination produces a vapor at "
-                "this pressure. Warning! approaching critical fluid".format(T, xi)
+                "    Flag 0: This T and yi, %s %s, combination produces a vapor at "
+                "this pressure. Warning! approaching critical fluid",
+                T,
+                xi,
             )
     elif l_roots == 2:
         if (Pvspline(roots[0]) + P) < 0.0:
             flag = 1
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 1: This T and yi, {} {}, combination produces a liquid "
-                "under tension at this pressure".format(T, xi)
+                "    Flag 1: This T and yi, %s %s, combination produces a liquid under "
+                "tension at this pressure",
+                T,
+                xi,
             )
         else:
-            slope, yroot = np.polyfit(vlist[-4:], Plist[-4:], 1)
+            slope, yroot = _pressure_tail_line(vlist, Plist)
             vroot = -yroot / slope
             try:
-                rho_tmp = spo.least_squares(
-                    pressure_spline_error,
+                rho_tmp = _solve_density_root(
                     1 / vroot,
-                    args=(P, T, xi, Eos),
-                    bounds=(np.finfo("float").eps, 1.0 / (1.1 * roots[-1])),
+                    (eps, 1.0 / (1.1 * roots[-1])),
+                    P,
+                    T,
+                    xi,
+                    Eos,
                 )
-                rho_tmp = rho_tmp.x
                 flag = 0
             except Exception:
                 rho_tmp = np.nan
@@ -595,59 +963,61 @@ def calc_vapor_density(P, T, xi, Eos, density_opts={}, **kwargs):
 
             if not len(extrema):
                 logger.debug(
-                    "    Flag 2: The T and yi, {} {}, combination produces a critical"
-                    " fluid at this pressure".format(T, xi)
+                    "    Flag 2: The T and yi, %s %s, combination produces a critical "
+                    "fluid at this pressure",
+                    T,
+                    xi,
                 )
             else:
                 logger.debug(
-                    "    Flag 0: This T and yi, {} {}, combination produces a vapor "
-                    "at this pressure. Warning! approaching critical fluid".format(
-                        T, xi
-                    )
+                    "    Flag 0: This T and yi, %s %s, combination produces a vapor at "
+                    "this pressure. Warning! approaching critical fluid",
+                    T,
+                    xi,
                 )
     else:  # 3 roots
         logger.debug(
-            "    Flag 0: This T and yi, {} {}, combination produces a vapor at this"
-            " pressure.".format(T, xi)
+            "    Flag 0: This T and yi, %s %s, combination produces a vapor at this "
+            "pressure.",
+            T,
+            xi,
         )
         rho_tmp = 1.0 / roots[2]
         flag = 0
 
     if flag in [0, 2]:  # vapor or critical fluid
         tmp = [rho_tmp * 0.99, rho_tmp * 1.01]
-        if rho_tmp * 1.01 > Eos.density_max(xi, T, maxpack=0.99):
-            tmp[1] = Eos.density_max(xi, T, maxpack=0.99)
+        if rho_tmp * 1.01 > rho_max:
+            tmp[1] = rho_max
 
-        if (
-            pressure_spline_error(tmp[0], P, T, xi, Eos)
-            * pressure_spline_error(tmp[1], P, T, xi, Eos)
-        ) < 0:
-            rho_tmp = spo.brentq(
+        P_tmp = pressure_spline_error(np.ravel(tmp).astype(float), P, T, xi, Eos)
+        if (P_tmp[0] * P_tmp[1]) < 0:
+            rho_tmp = _brenth_known_endpoints(
                 pressure_spline_error,
                 tmp[0],
                 tmp[1],
+                P_tmp[0],
+                P_tmp[1],
                 args=(P, T, xi, Eos),
                 rtol=0.0000001,
             )
         else:
             if Plist[0] < 0:
                 logger.warning(
-                    "    Density value could not be bounded with (rhomin,rhomax), "
-                    "{}. Using approximate density value".format(tmp)
+                    "    Density value could not be bounded with (rhomin,rhomax), %s. "
+                    "Using approximate density value",
+                    tmp,
                 )
             elif not flag_NoOpt:
                 rho_tmp = spo.least_squares(
                     pressure_spline_error,
                     rho_tmp,
                     args=(P, T, xi, Eos),
-                    bounds=(
-                        np.finfo("float").eps,
-                        Eos.density_max(xi, T, maxpack=0.99),
-                    ),
+                    bounds=(eps, rho_max),
                 )
                 rho_tmp = rho_tmp.x
 
-    logger.debug("    Vapor Density: {} mol/m^3, flag {}".format(rho_tmp, flag))
+    logger.debug("    Vapor Density: %s mol/m^3, flag %s", rho_tmp, flag)
 
     # pressure_vs_volume_plot(vlist, Plist, Pvspline, markers=extrema)
 
@@ -685,23 +1055,33 @@ def calc_liquid_density(P, T, xi, Eos, density_opts={}, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "    'calc_liquid_density' does not use the following keyword arguments: "
-            "{}".format(", ".join(list(kwargs.keys())))
+            "    'calc_liquid_density' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     # Get roots and local minima and maxima
-    vlist, Plist = pressure_vs_volume_arrays(T, xi, Eos, **density_opts)
+    vlist, Plist = _cached_pressure_vs_volume_arrays(T, xi, Eos, density_opts)
+    Pvspline, roots, extrema = _cached_shifted_volume_spline(
+        T, xi, Eos, density_opts, vlist, Plist, P
+    )
     Plist = Plist - P
-    Pvspline, roots, extrema = pressure_vs_volume_spline(vlist, Plist)
 
-    logger.debug("    Find rhol: P {} Pa, roots {} m^3/mol".format(P, str(roots)))
+    logger.debug("    Find rhol: P %s Pa, roots %s m^3/mol", P, str(roots))
+
+    # The packing-fraction limit only depends on T and xi, so evaluate it once
+    # and reuse it for every bound below, alongside the machine epsilon used as
+    # the lower density bound
+    rho_max = Eos.density_max(xi, T, maxpack=0.99)
+    eps = np.finfo("float").eps
+
     flag_NoOpt = False
 
     if extrema:
         if len(extrema) == 1:
             logger.warning(
-                "    One extrema at {}, assume weird minima behavior. Check your "
-                "parameters.".format(1 / extrema[0])
+                "    One extrema at %s, assume weird minima behavior. Check your "
+                "parameters.",
+                1 / extrema[0],
             )
 
     # Assess roots, what is the liquid density
@@ -710,57 +1090,55 @@ def calc_liquid_density(P, T, xi, Eos, density_opts={}, **kwargs):
         rho_tmp = np.nan
         flag = 3
         logger.warning(
-            "    Flag 3: The T and xi, {} {}, won't produce a fluid (vapor or liquid) "
-            "at this pressure".format(T, xi)
+            "    Flag 3: The T and xi, %s %s, won't produce a fluid (vapor or liquid) "
+            "at this pressure",
+            T,
+            xi,
         )
     elif l_roots == 0:
         if Pvspline(1 / vlist[-1]):
             try:
-                bounds = (1 / vlist[0], Eos.density_max(xi, T, maxpack=0.99))
-                rho_tmp = spo.least_squares(
-                    pressure_spline_error,
-                    np.mean(bounds),
-                    args=(P, T, xi, Eos),
-                    bounds=bounds,
-                )
-                rho_tmp = rho_tmp.x
+                bounds = (1 / vlist[0], rho_max)
+                rho_tmp = _solve_density_root(np.mean(bounds), bounds, P, T, xi, Eos)
                 if not len(extrema):
                     flag = 2
                     logger.debug(
-                        "    Flag 2: The T and xi, {} {}, ".format(T, xi)
-                        + "combination produces a critical fluid at this pressure"
+                        "    Flag 2: The T and xi, %s %s, combination produces a "
+                        "critical fluid at this pressure",
+                        T,
+                        xi,
                     )
                 else:
                     flag = 1
                     logger.debug(
-                        "    Flag 1: The T and xi, {} {}, ".format(T, xi)
-                        + "combination produces a liquid at this pressure"
+                        "    Flag 1: The T and xi, %s %s, combination produces a "
+                        "liquid at this pressure",
+                        T,
+                        xi,
                     )
             except Exception:
                 rho_tmp = np.nan
                 flag = 3
                 logger.warning(
-                    "    Flag 3: The T and xi, {} {}, ".format(
-                        T,
-                        xi,
-                    )
-                    + "won't produce a fluid (vapor or liquid) at this pressure, "
-                    + "without density greater than max, {}".format(
-                        Eos.density_max(xi, T, maxpack=0.99)
-                    )
+                    "    Flag 3: The T and xi, %s %s, won't produce a fluid (vapor or "
+                    "liquid) at this pressure, without density greater than max, %s",
+                    T,
+                    xi,
+                    rho_max,
                 )
             flag_NoOpt = True
         elif min(Plist) + P > 0:
-            slope, yroot = np.polyfit(vlist[-4:], Plist[-4:], 1)
+            slope, yroot = _pressure_tail_line(vlist, Plist)
             vroot = -yroot / slope
             try:
-                rho_tmp = spo.least_squares(
-                    pressure_spline_error,
+                rho_tmp = _solve_density_root(
                     1.0 / vroot,
-                    args=(P, T, xi, Eos),
-                    bounds=(np.finfo("float").eps, 1.0 / (1.1 * roots[-1])),
+                    (eps, 1.0 / (1.1 * roots[-1])),
+                    P,
+                    T,
+                    xi,
+                    Eos,
                 )
-                rho_tmp = rho_tmp.x
                 flag = 0
             except Exception:
                 rho_tmp = np.nan
@@ -768,20 +1146,25 @@ def calc_liquid_density(P, T, xi, Eos, density_opts={}, **kwargs):
 
             if not len(extrema):
                 logger.debug(
-                    "    Flag 2: The T and xi, {} {}, ".format(T, xi)
-                    + "combination produces a critical fluid at this pressure"
+                    "    Flag 2: The T and xi, %s %s, combination produces a critical "
+                    "fluid at this pressure",
+                    T,
+                    xi,
                 )
             else:
                 logger.debug(
-                    "    Flag 0: This T and xi, {} {},".format(T, xi)
-                    + " combination produces a vapor at this pressure. Warning!"
-                    + " approaching critical fluid"
+                    "    Flag 0: This T and xi, %s %s, combination produces a vapor at "
+                    "this pressure. Warning! approaching critical fluid",
+                    T,
+                    xi,
                 )
         else:
             flag = 3
             logger.error(
-                "    Flag 3: The T and xi, {} {},".format(T, xi)
-                + " won't produce a fluid (vapor or liquid) at this pressure"
+                "    Flag 3: The T and xi, %s %s, won't produce a fluid (vapor or "
+                "liquid) at this pressure",
+                T,
+                xi,
             )
             rho_tmp = np.nan
             # pressure_vs_volume_plot(vlist, Plist, Pvspline, markers=extrema)
@@ -790,8 +1173,10 @@ def calc_liquid_density(P, T, xi, Eos, density_opts={}, **kwargs):
             flag = 1
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 1: This T and xi, {} {},".format(T, xi)
-                + "combination produces a liquid under tension at this pressure"
+                "    Flag 1: This T and xi, %s %s,combination produces a liquid under "
+                "tension at this pressure",
+                T,
+                xi,
             )
         else:  # There should be three roots, but the values of specific volume
             # don't go far enough to pick up the last one
@@ -802,95 +1187,327 @@ def calc_liquid_density(P, T, xi, Eos, density_opts={}, **kwargs):
             flag = 2
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 2: The T and xi, {} {},".format(T, xi)
-                + "combination produces a critical fluid at this pressure"
+                "    Flag 2: The T and xi, %s %s,combination produces a critical fluid "
+                "at this pressure",
+                T,
+                xi,
             )
-        elif (Pvspline(roots[0]) + P) > (Pvspline(max(extrema)) + P):
+        elif _spline_higher_at_root(Pvspline, roots[0], extrema):
             flag = 1
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 1: The T and xi, {} {},".format(T, xi)
-                + "combination produces a liquid at this pressure"
+                "    Flag 1: The T and xi, %s %s,combination produces a liquid at this "
+                "pressure",
+                T,
+                xi,
             )
         elif len(extrema) > 1:
             flag = 0
             rho_tmp = 1.0 / roots[0]
             logger.debug(
-                "    Flag 0: This T and xi, {} {},".format(T, xi)
-                + " combination produces a vapor at this pressure. Warning! "
-                + "approaching critical fluid"
+                "    Flag 0: This T and xi, %s %s, combination produces a vapor at "
+                "this pressure. Warning! approaching critical fluid",
+                T,
+                xi,
             )
     else:  # 3 roots
         rho_tmp = 1.0 / roots[0]
         flag = 1
         logger.debug(
-            "    Flag 1: The T and xi, {} {},".format(T, xi)
-            + "combination produces a liquid at this pressure"
+            "    Flag 1: The T and xi, %s %s,combination produces a liquid at this "
+            "pressure",
+            T,
+            xi,
         )
 
     if flag in [1, 2]:  # liquid or critical fluid
         tmp = [rho_tmp * 0.99, rho_tmp * 1.01]
-        P_tmp = [
-            pressure_spline_error(tmp[0], P, T, xi, Eos),
-            pressure_spline_error(tmp[1], P, T, xi, Eos),
-        ]
+        P_tmp = pressure_spline_error(np.ravel(tmp).astype(float), P, T, xi, Eos)
         if (P_tmp[0] * P_tmp[1]) < 0:
-            rho_tmp = spo.brentq(
-                pressure_spline_error, tmp[0], tmp[1], args=(P, T, xi, Eos), rtol=1e-7
+            rho_tmp = _brenth_known_endpoints(
+                pressure_spline_error,
+                tmp[0],
+                tmp[1],
+                P_tmp[0],
+                P_tmp[1],
+                args=(P, T, xi, Eos),
+                rtol=1e-7,
             )
         else:
             if P_tmp[0] < 0:
                 logger.warning(
-                    "    Density value could not be bounded with (rhomin,rhomax),"
-                    + " {}. Using approximate density value".format(tmp)
+                    "    Density value could not be bounded with (rhomin,rhomax), %s. "
+                    "Using approximate density value",
+                    tmp,
                 )
             elif not flag_NoOpt:
                 rho_tmp = spo.least_squares(
                     pressure_spline_error,
                     rho_tmp,
                     args=(P, T, xi, Eos),
-                    bounds=(
-                        np.finfo("float").eps,
-                        Eos.density_max(xi, T, maxpack=0.99),
-                    ),
+                    bounds=(eps, rho_max),
                 )
                 rho_tmp = rho_tmp.x[0]
-    logger.debug("    Liquid Density: {} mol/m^3, flag {}".format(rho_tmp, flag))
+    logger.debug("    Liquid Density: %s mol/m^3, flag %s", rho_tmp, flag)
+
+    # Flag: 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither
+    # is true
+    return rho_tmp, flag
+
+
+def pressure_spline_error(rho, Pset, T, xi, Eos):
+    """
+    Calculate difference between set point pressure and computed pressure for a given
+    density.
+
+    Used to ensure an accurate value from the EOS rather than an estimate from a spline.
+
+    Parameters
+    ----------
+    rho : float or numpy.ndarray
+        [mol/:math:`m^3`] Density of system. An array of densities is evaluated
+        in a single EOS call, so bracket checks should be batched rather than
+        issued point by point.
+    Pset : float
+        [Pa] Guess in pressure of the system
+    T : float
+        [K] Temperature of the system
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    Eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+
+    Returns
+    -------
+    pressure_spline_error : float or numpy.ndarray
+        [Pa] Difference in set pressure and predicted pressure given system conditions.
+    """
+
+    Pguess = Eos.pressure(rho, T, xi)
+
+    return Pguess - Pset
+
+
+def _brenth_known_endpoints(f, a, b, fa, fb, args=(), rtol=1e-7):
+    r"""
+    Bracketed root solve that reuses precomputed endpoint evaluations.
+
+    brenth evaluates both bracket ends on entry, but every caller here has
+    already evaluated them for the sign-change check and each evaluation costs
+    a full EOS call, so serve the known values instead of recomputing them.
+    """
+
+    # Bind the arguments into the closure so the root finder's inner loop pays
+    # neither the args-tuple unpacking nor a repeated attribute lookup
+    known = {a: fa, b: fb}
+
+    def func(x):
+        if x in known:
+            return known[x]
+        return f(x, *args)
+
+    return spo.brenth(func, a, b, rtol=rtol)
+
+
+def _pressure_spline_error_log_density(log_rho, Pset, T, xi, Eos):
+    r"""
+    Evaluate :func:`pressure_spline_error` against the natural log of density.
+
+    The liquid branch of P(:math:`\rho`) is steep in density but smooth on a
+    logarithmic density axis, so root solving in log space converges in fewer
+    EOS evaluations when the bracket spans orders of magnitude.
+    """
+
+    return pressure_spline_error(np.exp(log_rho), Pset, T, xi, Eos)
+
+
+def _solve_density_root(rho_guess, bounds, P, T, xi, Eos):
+    r"""
+    Solve :func:`~despasito.thermodynamics.calc.pressure_spline_error` for density.
+
+    If the bounds bracket a sign change, the root is found directly with brenth,
+    which needs far fewer EOS evaluations than a bounded minimization. Otherwise
+    fall back on bounded least squares from the given initial guess.
+
+    Parameters
+    ----------
+    rho_guess : float
+        [mol/:math:`m^3`] Initial guess in density of the system
+    bounds : tuple
+        [mol/:math:`m^3`] Lower and upper bounds on the density root
+    P : float
+        [Pa] Pressure of the system
+    T : float
+        [K] Temperature of the system
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    Eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+
+    Returns
+    -------
+    rho : float
+        [mol/:math:`m^3`] Density at which the EOS pressure matches the set pressure
+    """
+
+    # One batched EOS call for both bounds instead of two single-point calls.
+    # The bounds span orders of magnitude in density, so both the root solve
+    # and the fallback operate in log density where P(rho) is better behaved
+    obj_bounds = pressure_spline_error(np.asarray(bounds, float), P, T, xi, Eos)
+    log_bounds = np.log(bounds)
+    if (obj_bounds[0] * obj_bounds[1]) < 0:
+        return np.exp(
+            _brenth_known_endpoints(
+                _pressure_spline_error_log_density,
+                log_bounds[0],
+                log_bounds[1],
+                obj_bounds[0],
+                obj_bounds[1],
+                args=(P, T, xi, Eos),
+                rtol=1e-7,
+            )
+        )
+
+    output = spo.least_squares(
+        _pressure_spline_error_log_density,
+        np.log(rho_guess),
+        args=(P, T, xi, Eos),
+        bounds=log_bounds,
+    )
+    return np.exp(output.x)
+
+
+# Memoized fugacity coefficient results keyed on the system state. Iterative
+# composition and pressure-range solvers frequently revisit state points they
+# evaluated a few iterations earlier, and each miss costs a full density solve
+# plus an EOS fugacity evaluation.
+_fugacity_cache = {}
+_FUGACITY_CACHE_MAXSIZE = 4096
+
+
+def _fugacity_cache_key(phase, P, T, zi, Eos, density_opts):
+    r"""
+    Build a hashable key identifying a fugacity coefficient calculation.
+
+    Compositions are rounded so values differing only by floating point noise
+    share an entry. Raises TypeError if ``density_opts`` contains unhashable
+    values, in which case caching is skipped.
+    """
+
+    key = (
+        phase,
+        id(Eos),
+        float(P),
+        float(T),
+        tuple(np.round(np.asarray(zi, dtype=float), 12).tolist()),
+        tuple(sorted(density_opts.items())),
+    )
+    hash(key)
+
+    return key
+
+
+def _fugacity_cache_store(cache_key, phi, rho, flag):
+    r"""Store a fugacity coefficient result, evicting the oldest entry when full."""
+
+    if len(_fugacity_cache) >= _FUGACITY_CACHE_MAXSIZE:
+        _fugacity_cache.pop(next(iter(_fugacity_cache)))
+    _fugacity_cache[cache_key] = (np.array(phi), rho, flag)
+
+
+# Memoized saturation properties. Bubble, dew, and flash calculations
+# bootstrap with one pure-component saturation solve per component, and
+# pressure sweeps at fixed temperature repeat them with identical inputs.
+_saturation_cache = {}
+_SATURATION_CACHE_MAXSIZE = 128
+
+
+def _saturation_cache_key(T, zi, Eos, density_opts, tol, Pconverged):
+    r"""
+    Build a hashable key identifying a saturation property calculation, or
+    None when ``density_opts`` contains unhashable values.
+    """
+
+    key = (
+        id(Eos),
+        float(T),
+        tuple(np.round(np.asarray(zi, dtype=float), 12).tolist()),
+        tuple(sorted(density_opts.items())),
+        float(tol),
+        float(Pconverged),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
 
-    # Flag: 0 is vapor, 1 is liquid, 2 mean a critical fluid, 3 means that neither
-    # is true
-    return rho_tmp, flag
+    return key
 
 
-def pressure_spline_error(rho, Pset, T, xi, Eos):
-    """
-    Calculate difference between set point pressure and computed pressure for a given
-    density.
+def _saturation_cache_store(cache_key, result):
+    r"""Store a saturation result, evicting the oldest entry when full."""
 
-    Used to ensure an accurate value from the EOS rather than an estimate from a spline.
+    if len(_saturation_cache) >= _SATURATION_CACHE_MAXSIZE:
+        _saturation_cache.pop(next(iter(_saturation_cache)))
+    _saturation_cache[cache_key] = result
 
-    Parameters
-    ----------
-    rho : float
-        [mol/:math:`m^3`] Density of system
-    Pset : float
-        [Pa] Guess in pressure of the system
-    T : float
-        [K] Temperature of the system
-    xi : numpy.ndarray
-        Mole fraction of each component, sum(xi) should equal 1.0
-    Eos : obj
-        An instance of the defined EOS class to be used in thermodynamic computations.
 
-    Returns
-    -------
-    pressure_spline_error : float
-        [Pa] Difference in set pressure and predicted pressure given system conditions.
+# Converged phase compositions from earlier dew/bubble solves, used to
+# warm-start the next solve of the same system (e.g. along a phase envelope)
+# when the module-level composition guess is unset or invalid
+_composition_guess_cache = {}
+_COMPOSITION_GUESS_CACHE_MAXSIZE = 32
+
+
+def _store_composition_guess(phase, zi, Eos, T, solution):
+    r"""Record a converged composition for reuse as a later initial guess."""
+
+    solution = np.asarray(solution, dtype=float)
+    if not np.all(np.isfinite(solution)):
+        return
+    key = (
+        phase,
+        id(Eos),
+        tuple(np.round(np.asarray(zi, dtype=float), 12).tolist()),
+    )
+    if (
+        key not in _composition_guess_cache
+        and len(_composition_guess_cache) >= _COMPOSITION_GUESS_CACHE_MAXSIZE
+    ):
+        _composition_guess_cache.pop(next(iter(_composition_guess_cache)))
+    _composition_guess_cache[key] = (float(T), solution.copy())
+
+
+def _recall_composition_guess(phase, zi, Eos):
+    r"""
+    Look up the composition solved most recently for this system.
+
+    Returns a (T, composition) tuple or None. The temperature is reported so
+    callers can log how far the warm start is from the current state.
     """
 
-    Pguess = Eos.pressure(rho, T, xi)
+    key = (
+        phase,
+        id(Eos),
+        tuple(np.round(np.asarray(zi, dtype=float), 12).tolist()),
+    )
 
-    return Pguess - Pset
+    return _composition_guess_cache.get(key)
+
+
+def clear_fugacity_cache():
+    r"""
+    Empty the memoized fugacity coefficient results.
+
+    Called whenever the EOS object may have changed (e.g. between parameter
+    fitting iterations) so stale entries cannot be returned.
+    """
+
+    _fugacity_cache.clear()
+    _pressure_sweep_cache.clear()
+    _isotherm_spline_cache.clear()
+    _composition_guess_cache.clear()
+    _saturation_cache.clear()
 
 
 def calc_vapor_fugacity_coefficient(P, T, yi, Eos, density_opts={}, **kwargs):
@@ -924,10 +1541,19 @@ def calc_vapor_fugacity_coefficient(P, T, yi, Eos, density_opts={}, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "    'calc_vapor_fugacity_coefficient' does not use the following "
-            + "keyword arguments: {}".format(", ".join(list(kwargs.keys())))
+            "    'calc_vapor_fugacity_coefficient' does not use the following keyword "
+            "arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
+    try:
+        cache_key = _fugacity_cache_key("vapor", P, T, yi, Eos, density_opts)
+    except TypeError:
+        cache_key = None
+    if cache_key is not None and cache_key in _fugacity_cache:
+        phiv, rhov, flagv = _fugacity_cache[cache_key]
+        return np.array(phiv), rhov, flagv
+
     rhov, flagv = calc_vapor_density(P, T, yi, Eos, density_opts)
     if flagv == 4:
         phiv = np.ones_like(yi)
@@ -938,6 +1564,9 @@ def calc_vapor_fugacity_coefficient(P, T, yi, Eos, density_opts={}, **kwargs):
     else:
         phiv = Eos.fugacity_coefficient(P, rhov, yi, T)
 
+    if cache_key is not None:
+        _fugacity_cache_store(cache_key, phiv, rhov, flagv)
+
     return phiv, rhov, flagv
 
 
@@ -972,16 +1601,28 @@ def calc_liquid_fugacity_coefficient(P, T, xi, Eos, density_opts={}, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "    'calc_liquid_fugacity_coefficient' does not use the following keyword"
-            " arguments: {}".format(", ".join(list(kwargs.keys())))
+            "    'calc_liquid_fugacity_coefficient' does not use the following keyword "
+            "arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
+    try:
+        cache_key = _fugacity_cache_key("liquid", P, T, xi, Eos, density_opts)
+    except TypeError:
+        cache_key = None
+    if cache_key is not None and cache_key in _fugacity_cache:
+        phil, rhol, flagl = _fugacity_cache[cache_key]
+        return np.array(phil), rhol, flagl
+
     rhol, flagl = calc_liquid_density(P, T, xi, Eos, density_opts)
     if flagl == 3:
         phil = np.array([np.nan, np.nan])
     else:
         phil = Eos.fugacity_coefficient(P, rhol, xi, T)
 
+    if cache_key is not None:
+        _fugacity_cache_store(cache_key, phil, rhol, flagl)
+
     return phil, rhol, flagl
 
 
@@ -1027,18 +1668,70 @@ def calc_new_mole_fractions(phase_1_mole_fraction, phil, phiv, phase=None):
     if np.any(np.isnan(phil)):
         raise ValueError("Liquid fugacity coefficients should not be NaN")
 
-    phase_2_mole_fraction = np.zeros(len(phase_1_mole_fraction))
-    ind = np.where(phase_1_mole_fraction != 0.0)[0]
+    # Single safe-divide pass over the components; entries with zero mole
+    # fraction stay zero and their fugacity coefficients are never divided by
+    phase_1_mole_fraction = np.asarray(phase_1_mole_fraction, dtype=float)
+    phil, phiv = np.asarray(phil, dtype=float), np.asarray(phiv, dtype=float)
+    phase_2_mole_fraction = np.zeros_like(phase_1_mole_fraction)
+    ind = phase_1_mole_fraction != 0.0
     if phase == "vapor":
-        for i in ind:
-            phase_2_mole_fraction[i] = phase_1_mole_fraction[i] * phil[i] / phiv[i]
+        np.divide(
+            phase_1_mole_fraction * phil, phiv, out=phase_2_mole_fraction, where=ind
+        )
     elif phase == "liquid":
-        for i in ind:
-            phase_2_mole_fraction[i] = phase_1_mole_fraction[i] * phiv[i] / phil[i]
+        np.divide(
+            phase_1_mole_fraction * phiv, phil, out=phase_2_mole_fraction, where=ind
+        )
 
     return phase_2_mole_fraction
 
 
+def _anderson_accelerated_step(step_history, max_mixing=5.0):
+    r"""
+    Propose a depth-one Anderson accelerated successive substitution step.
+
+    Given the last two (guess, update) pairs of a successive substitution map,
+    extrapolate along the residual difference to a guess that is usually much
+    closer to the fixed point than the plain update.
+
+    Parameters
+    ----------
+    step_history : list[tuple]
+        The last two (guess, update) pairs produced by the successive
+        substitution map, oldest first.
+    max_mixing : float, Optional, default=5.0
+        Reject extrapolations whose mixing coefficient exceeds this magnitude,
+        since nearly parallel residuals make the extrapolation unreliable.
+
+    Returns
+    -------
+    accelerated_guess : numpy.ndarray or None
+        Accelerated mole fraction guess, or None when the extrapolation is not
+        trustworthy and the plain update should be used instead.
+    """
+
+    (y0, g0), (y1, g1) = step_history
+    f0, f1 = g0 - y0, g1 - y1
+    df = f1 - f0
+    denominator = np.dot(df, df)
+    if denominator == 0.0:
+        return None
+
+    mixing = np.dot(f1, df) / denominator
+    if not np.isfinite(mixing) or np.abs(mixing) > max_mixing:
+        return None
+
+    accelerated_guess = g1 - mixing * (g1 - g0)
+    if (
+        not np.all(np.isfinite(accelerated_guess))
+        or np.any(accelerated_guess < 0.0)
+        or np.sum(accelerated_guess) == 0.0
+    ):
+        return None
+
+    return accelerated_guess
+
+
 def equilibrium_objective(phase_1_mole_fraction, phil, phiv, phase=None):
     r"""
 
@@ -1107,12 +1800,78 @@ def _clean_plot_data(x_old, y_old):
         New dependent variable
     """
 
-    x_new = np.sort(np.array(list(set(x_old))))
-    y_new = np.array([y_old[np.where(np.array(x_old) == x)[0][0]] for x in x_new])
+    # np.unique sorts and deduplicates in one C pass, and return_index keeps
+    # the first y value recorded for each x as the old set/scan version did
+    x_new, ind = np.unique(np.asarray(x_old), return_index=True)
+    y_new = np.asarray(y_old)[ind]
 
     return x_new, y_new
 
 
+def _bracketed_pressure_guess(
+    Prange, ObjRange, xi, T, Eos, density_opts, mole_fraction_options
+):
+    r"""
+    Refine the equilibrium pressure guess inside a bracketing pressure range.
+
+    When the bracket ends have finite objective values of opposite sign, the
+    guess is polished with the TOMS 748 bracketed root algorithm, which
+    converges in a handful of objective evaluations. Otherwise, or if the
+    solve fails, fall back on linear interpolation between the bracket ends.
+
+    Parameters
+    ----------
+    Prange : numpy.ndarray
+        [Pa] Minimum and maximum pressure bracketing the equilibrium pressure
+    ObjRange : numpy.ndarray
+        Objective values at the bracket ends
+    xi : numpy.ndarray
+        Liquid mole fraction of each component, sum(xi) should equal 1.0
+    T : float
+        [K] Temperature of the system
+    Eos : obj
+        An instance of the defined EOS class to be used in thermodynamic computations.
+    density_opts : dict
+        Dictionary of options used in calculating pressure vs. specific volume in
+        :func:`~despasito.thermodynamics.calc.pressure_vs_volume_arrays`
+    mole_fraction_options : dict
+        Options used to solve the inner loop in the solving algorithm
+
+    Returns
+    -------
+    Pguess : float
+        [Pa] Estimated equilibrium pressure within the bracket
+    """
+
+    if np.all(np.isfinite(ObjRange)) and ObjRange[0] * ObjRange[1] < 0:
+        try:
+            return spo.toms748(
+                lambda p: objective_bubble_pressure(
+                    p,
+                    xi,
+                    T,
+                    Eos,
+                    density_opts=density_opts,
+                    mole_fraction_options=mole_fraction_options,
+                ),
+                Prange[0],
+                Prange[1],
+                rtol=1e-4,
+                maxiter=30,
+            )
+        except (ValueError, RuntimeError):
+            logger.debug(
+                "Bracketed root solve failed in range %s, falling back on linear "
+                "interpolation",
+                Prange,
+            )
+
+    slope = (ObjRange[1] - ObjRange[0]) / (Prange[1] - Prange[0])
+    intercept = ObjRange[1] - slope * Prange[1]
+
+    return -intercept / slope
+
+
 def calc_Prange_xi(
     T,
     xi,
@@ -1166,8 +1925,8 @@ def calc_Prange_xi(
         If two iterations in the search for the maximum pressure are within this
         tolerance, the search is discontinued
     xytol : float, Optional, default=0.01
-        If the sum of absolute relative difference between the vapor and liquid mole
-        fractions are less than this total, the pressure is assumed to be super
+        If the largest absolute relative difference between the vapor and liquid
+        mole fractions is below this value, the pressure is assumed to be super
         critical and the maximum pressure is sought at a lower value.
     maxfactor : float, Optional, default=2
         Factor to multiply by the pressure if it is too low (produces liquid or
@@ -1187,15 +1946,14 @@ def calc_Prange_xi(
 
     if len(kwargs) > 0:
         logger.debug(
-            "'calc_Prange_xi' does not use the following keyword arguments: {}".format(
-                ", ".join(list(kwargs.keys()))
-            )
+            "'calc_Prange_xi' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     global _yi_global
 
     # Guess a range from Pmin to the local max of the liquid curve
-    vlist, Plist = pressure_vs_volume_arrays(T, xi, Eos, **density_opts)
+    vlist, Plist = _cached_pressure_vs_volume_arrays(T, xi, Eos, density_opts)
     Pvspline, roots, extrema = pressure_vs_volume_spline(vlist, Plist)
 
     flag_hard_min = False
@@ -1243,7 +2001,7 @@ def calc_Prange_xi(
             p, T, xi, Eos, density_opts=density_opts
         )
 
-        if any(np.isnan(phil)):
+        if np.isnan(phil).any():
             logger.error("Estimated minimum pressure is too high.")
             flag_max = True
             flag_liquid = True
@@ -1283,10 +2041,13 @@ def calc_Prange_xi(
                 p = (Prange[1] - Prange[0]) / 2.0 + Prange[0]
 
             # If within tolerance of liquid mole fraction
-            elif np.sum(np.abs(xi - yi_range) / xi) < xytol and flagv_min == 2:
+            elif np.max(np.abs(xi - yi_range) / xi) < xytol and flagv_min == 2:
                 logger.info(
-                    "Estimated minimum pressure reproduces xi: "
-                    "{},  Obj. Func: {}, Range {}".format(p, obj, Prange)
+                    "Estimated minimum pressure reproduces xi: %s,  Obj. Func: %s, "
+                    "Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 if (
                     flag_max or flag_hard_max
@@ -1358,8 +2119,11 @@ def calc_Prange_xi(
             # If 'vapor' phase is liquid or unattainable
             elif flagv_min not in [0, 2, 4]:
                 logger.info(
-                    "Estimated minimum pressure produces liquid: "
-                    "{},  Obj. Func: {}, Range {}".format(p, obj, Prange)
+                    "Estimated minimum pressure produces liquid: %s,  Obj. Func: %s, "
+                    "Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 if flag_hard_min and p <= Pmin:
                     flag_critical = True
@@ -1394,16 +2158,20 @@ def calc_Prange_xi(
             # Found minimum pressure!
             elif obj > 0:
                 logger.info(
-                    "Found estimated minimum pressure: "
-                    "{},  Obj. Func: {}, Range {}".format(p, obj, Prange)
+                    "Found estimated minimum pressure: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 Prange[0] = p
                 ObjRange[0] = obj
                 break
             elif obj < 0:
                 logger.info(
-                    "Estimated minimum pressure too high: "
-                    "{},  Obj. Func: {}, Range {}".format(p, obj, Prange)
+                    "Estimated minimum pressure too high: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 flag_liquid = True
                 flag_max = True
@@ -1434,8 +2202,10 @@ def calc_Prange_xi(
                 )
         else:
             logger.info(
-                "Estimated minimum pressure produced vapor as a 'liquid' phase: "
-                "{}, Range {}".format(p, Prange)
+                "Estimated minimum pressure produced vapor as a 'liquid' phase: %s, "
+                "Range %s",
+                p,
+                Prange,
             )
             flag_vapor = True
             flag_min = True
@@ -1481,7 +2251,7 @@ def calc_Prange_xi(
     # Be sure guess in upper bound is larger than lower bound
     if Prange[1] <= Prange[0]:
         Prange[1] = Prange[0] * maxfactor
-        ObjRange[1] == 0.0
+        ObjRange[1] = 0.0
 
     flag_min = False  # Signals that the objective value starts to increase again
     # and we must go back
@@ -1495,10 +2265,10 @@ def calc_Prange_xi(
             p, T, xi, Eos, density_opts=density_opts
         )
 
-        if any(np.isnan(phil)):
+        if np.isnan(phil).any():
             logger.info(
-                "Liquid fugacity coefficient should not be NaN, pressure could be "
-                + "too high."
+                "Liquid fugacity coefficient should not be NaN, pressure could be too "
+                "high."
             )
             flag_max = True
             Prange[1] = p
@@ -1522,10 +2292,11 @@ def calc_Prange_xi(
         # If 'vapor' phase is a liquid
         if flagv_max not in [0, 2, 4] or np.any(np.isnan(yi_range)):
             logger.info(
-                "New Maximum Pressure: "
-                + "{} isn't vapor, flag={}, Obj Func: {}, Range {}".format(
-                    p, flagv_max, obj, Prange
-                )
+                "New Maximum Pressure: %s isn't vapor, flag=%s, Obj Func: %s, Range %s",
+                p,
+                flagv_max,
+                obj,
+                Prange,
             )
             if flag_critical:  # looking for critical fluid
                 Prange[0] = p
@@ -1544,10 +2315,11 @@ def calc_Prange_xi(
                 p = (Prange[1] - Prange[0]) / 2.0 + Prange[0]
 
         # If 'liquid' composition is reproduced
-        elif np.sum(np.abs(xi - yi_range) / xi) < xytol:  # If less than 2%
+        elif np.max(np.abs(xi - yi_range) / xi) < xytol:  # If less than 2%
             logger.info(
-                "Estimated Maximum Pressure Reproduces xi: "
-                + "{},  Obj. Func: {}".format(p, obj)
+                "Estimated Maximum Pressure Reproduces xi: %s,  Obj. Func: %s",
+                p,
+                obj,
             )
             flag_max = True
             ObjRange[1] = obj
@@ -1556,9 +2328,11 @@ def calc_Prange_xi(
         # Suitable objective value found
         elif obj < 0:
             logger.info(
-                "New Max Pressure: {}, flag={}, Obj Func: {}, Range {}".format(
-                    p, flagv_max, obj, Prange
-                )
+                "New Max Pressure: %s, flag=%s, Obj Func: %s, Range %s",
+                p,
+                flagv_max,
+                obj,
+                Prange,
             )
             if Prange[1] < p:
                 Prange[0] = Prange[1]
@@ -1566,9 +2340,9 @@ def calc_Prange_xi(
             Prange[1] = p
             ObjRange[1] = obj
             logger.info("Got the pressure range!")
-            slope = (ObjRange[1] - ObjRange[0]) / (Prange[1] - Prange[0])
-            intercept = ObjRange[1] - slope * Prange[1]
-            Pguess = -intercept / slope
+            Pguess = _bracketed_pressure_guess(
+                Prange, ObjRange, xi, T, Eos, density_opts, mole_fraction_options
+            )
             flag_min = False
             break
         else:
@@ -1584,8 +2358,10 @@ def calc_Prange_xi(
                 ObjRange[1] = obj
 
                 logger.info(
-                    "Maximum Pressure (if it exists) between Pressure: "
-                    + "{} and Obj Range: {}".format(Prange, ObjRange)
+                    "Maximum Pressure (if it exists) between Pressure: %s and Obj "
+                    "Range: %s",
+                    Prange,
+                    ObjRange,
                 )
 
                 P0 = np.mean(Prange)
@@ -1608,9 +2384,10 @@ def calc_Prange_xi(
                     mole_fraction_options=mole_fraction_options,
                 )
                 logger.info(
-                    "New Max Pressure: {}, Obj Func: {}, Range {}".format(
-                        p, obj, Prange
-                    )
+                    "New Max Pressure: %s, Obj Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
 
                 if p < 0:
@@ -1639,50 +2416,63 @@ def calc_Prange_xi(
                         p_min = p_min[obj_tmp == np.nanmin(obj_tmp)]
                     elif len(p_min) == 0:
                         logger.error(
-                            "Could not find minimum in pressure range:\n    Pressure:"
-                            + " {}\n    Obj Value: {}".format(parray, obj_array)
+                            "Could not find minimum in pressure range:\n    Pressure: "
+                            "%s\n    Obj Value: %s",
+                            parray,
+                            obj_array,
                         )
                     p = p_min
                     obj = objective_bubble_pressure(
                         p, xi, T, Eos, density_opts=density_opts
                     )
                     logger.info(
-                        "New Max Pressure: {}, Obj Func: {}, Range {}".format(
-                            p, obj, Prange
-                        )
+                        "New Max Pressure: %s, Obj Func: %s, Range %s",
+                        p,
+                        obj,
+                        Prange,
                     )
 
                 if obj > 0:
                     Prange[1] = p
                     ObjRange[1] = obj
                     logger.info("Got the pressure range!")
-                    slope = (ObjRange[1] - ObjRange[0]) / (Prange[1] - Prange[0])
-                    intercept = ObjRange[1] - slope * Prange[1]
-                    Pguess = -intercept / slope
+                    Pguess = _bracketed_pressure_guess(
+                        Prange,
+                        ObjRange,
+                        xi,
+                        T,
+                        Eos,
+                        density_opts,
+                        mole_fraction_options,
+                    )
                     flag_min = False
                 else:
                     logger.error(
-                        "Could not find maximum in pressure range:\n    Pressure "
-                        + "range {} best {}\n    Obj Value range {} best {}".format(
-                            Prange, p, ObjRange, obj
-                        )
+                        "Could not find maximum in pressure range:\n    Pressure range "
+                        "%s best %s\n    Obj Value range %s best %s",
+                        Prange,
+                        p,
+                        ObjRange,
+                        obj,
                     )
                 break
 
             elif flag_max:
                 logger.info(
-                    "New Minimum Pressure: {},  Obj. Func: {}, Range {}".format(
-                        p, obj, Prange
-                    )
+                    "New Minimum Pressure: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 Prange[0] = p
                 ObjRange[0] = obj
                 p = (Prange[1] - Prange[0]) / 2.0 + Prange[0]
             else:
                 logger.info(
-                    "New Maximum Pressure: {},  Obj. Func: {}, Range {}".format(
-                        p, obj, Prange
-                    )
+                    "New Maximum Pressure: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 if not flag_hard_max:
                     if Prange[1] < p:
@@ -1694,7 +2484,7 @@ def calc_Prange_xi(
                 intercept = ObjRange[1] - slope * Prange[1]
 
                 if flag_hard_max:
-                    p = (Prange[1] - Prange[0]) * np.random.rand(1)[0] + Prange[0]
+                    p = (Prange[1] - Prange[0]) * random.random() + Prange[0]
                 else:
                     p = np.nanmax([-intercept / slope, maxfactor * Prange[1]])
 
@@ -1713,21 +2503,21 @@ def calc_Prange_xi(
     if z == maxiter - 1 or flag_min:
         if flag_min:
             logger.error(
-                "Cannot reach objective value of zero. Final Pressure: "
-                + "{}, Obj. Func: {}".format(p, obj)
+                "Cannot reach objective value of zero. Final Pressure: %s, Obj. Func: "
+                "%s",
+                p,
+                obj,
             )
         else:
             logger.error(
-                "Maximum Number of Iterations Reached: A change in sign for the"
-                + " objective function could not be found, inspect progress"
+                "Maximum Number of Iterations Reached: A change in sign for the "
+                "objective function could not be found, inspect progress"
             )
         Prange = np.array([np.nan, np.nan])
         Pguess = np.nan
     else:
-        logger.info(
-            "[Pmin, Pmax]: {}, Obj. Values: {}".format(str(Prange), str(ObjRange))
-        )
-        logger.info("Initial guess in pressure: {} Pa".format(Pguess))
+        logger.info("[Pmin, Pmax]: %s, Obj. Values: %s", str(Prange), str(ObjRange))
+        logger.info("Initial guess in pressure: %s Pa", Pguess)
 
         _yi_global = yi_range
 
@@ -1788,9 +2578,9 @@ def calc_Prange_yi(
         If two iterations in the search for the maximum pressure are within this
         tolerance, the search is discontinued
     xytol : float, Optional, default=0.01
-        If the sum of absolute relative difference between the vapor and liquid mole
-        fractions are less than this total, the pressure is assumed to be super critical
-        and the maximum pressure is sought at a lower value.
+        If the largest absolute relative difference between the vapor and liquid
+        mole fractions is below this value, the pressure is assumed to be super
+        critical and the maximum pressure is sought at a lower value.
     maxfactor : float, Optional, default=2
         Factor to multiply by the pressure if it is too low (produces liquid or positive
         objective value). Not used if an unfeasible maximum pressure is found to bound
@@ -1810,15 +2600,14 @@ def calc_Prange_yi(
 
     if len(kwargs) > 0:
         logger.debug(
-            "'calc_Prange_yi' does not use the following keyword arguments: {}".format(
-                ", ".join(list(kwargs.keys()))
-            )
+            "'calc_Prange_yi' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     global _xi_global
 
     # Guess a range from Pmin to the local max of the liquid curve
-    vlist, Plist = pressure_vs_volume_arrays(T, yi, Eos, **density_opts)
+    vlist, Plist = _cached_pressure_vs_volume_arrays(T, yi, Eos, density_opts)
     Pvspline, roots, extrema = pressure_vs_volume_spline(vlist, Plist)
 
     # Calculation the highest pressure possible
@@ -1864,7 +2653,7 @@ def calc_Prange_yi(
         phiv, _, flagv = calc_vapor_fugacity_coefficient(
             p, T, yi, Eos, density_opts=density_opts
         )
-        if any(np.isnan(phiv)):
+        if np.isnan(phiv).any():
             logger.error("Estimated minimum pressure is too high.")
             flag_max = True
             ObjRange[1] = np.inf
@@ -1905,11 +2694,14 @@ def calc_Prange_yi(
                     p = p * minfactor
 
             elif (
-                np.sum(np.abs(yi - xi_range) / yi) < xytol and flagl_min == 2
+                np.max(np.abs(yi - xi_range) / yi) < xytol and flagl_min == 2
             ):  # If within 2% of liquid mole fraction
                 logger.info(
-                    "Estimated Minimum Pressure Reproduces yi: "
-                    + "{},  Obj. Func: {}, Range {}".format(p, obj, Prange)
+                    "Estimated Minimum Pressure Reproduces yi: %s,  Obj. Func: %s, "
+                    "Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
 
                 if (
@@ -1949,23 +2741,29 @@ def calc_Prange_yi(
                 Prange[0] = p
                 ObjRange[0] = obj
                 logger.info(
-                    "Obtained estimated Minimum Pressure: "
-                    + "{},  Obj. Func: {}, Range {}".format(p, obj, Prange)
+                    "Obtained estimated Minimum Pressure: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 break
             elif obj > 0:
                 flag_max = True
                 logger.info(
-                    "Estimated Minimum Pressure too High: "
-                    + "{},  Obj. Func: {}, Range {}".format(p, obj, Prange)
+                    "Estimated Minimum Pressure too High: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 ObjRange[1] = obj
                 Prange[1] = p
                 p = (Prange[1] - Prange[0]) * minfactor + Prange[0]
         else:
             logger.info(
-                "Estimated Minimum Pressure Produced Liquid instead of Vapor Phase:"
-                + " {}, Range {}".format(p, Prange)
+                "Estimated Minimum Pressure Produced Liquid instead of Vapor Phase: "
+                "%s, Range %s",
+                p,
+                Prange,
             )
             if flag_hard_min and p <= Pmin:
                 flag_critical = True
@@ -2010,7 +2808,7 @@ def calc_Prange_yi(
             and (flag_min or flag_hard_min)
             and not Prange[0] <= p <= Prange[1]
         ):
-            p = (Prange[1] - Prange[0]) * np.random.rand(1)[0] + Prange[0]
+            p = (Prange[1] - Prange[0]) * random.random() + Prange[0]
 
         if flag_hard_min and Pmin == p:
             raise ValueError(
@@ -2035,7 +2833,7 @@ def calc_Prange_yi(
     if Prange[1] <= Prange[0]:
         Prange[1] = Prange[0] * 1.1
         if z == 0:
-            ObjRange[1] == 0.0
+            ObjRange[1] = 0.0
 
     # Check Pmax
     flag_sol = False
@@ -2069,8 +2867,12 @@ def calc_Prange_yi(
             Prange[1] = p
             ObjRange[1] = obj
             logger.info(
-                "New Max Pressure: {} doesn't produce vapor,".format(Prange[1])
-                + " flag={}, Obj Func: {}, Range {}".format(flagv, ObjRange[1], Prange)
+                "New Max Pressure: %s doesn't produce vapor, flag=%s, Obj Func: %s, "
+                "Range %s",
+                Prange[1],
+                flagv,
+                ObjRange[1],
+                Prange,
             )
             p = (Prange[1] - Prange[0]) / 2.0 + Prange[0]
         elif obj > 0:  # Check pressure range
@@ -2080,9 +2882,11 @@ def calc_Prange_yi(
             Prange[1] = p
             ObjRange[1] = obj
             logger.info(
-                "New Max Pressure: {}, flag={}, Obj Func: {}, Range {}".format(
-                    Prange[1], flagv, ObjRange[1], Prange
-                )
+                "New Max Pressure: %s, flag=%s, Obj Func: %s, Range %s",
+                Prange[1],
+                flagv,
+                ObjRange[1],
+                Prange,
             )
             logger.info("Got the pressure range!")
             slope = (ObjRange[1] - ObjRange[0]) / (Prange[1] - Prange[0])
@@ -2096,9 +2900,10 @@ def calc_Prange_yi(
             ObjRange[0] = obj
             p = (Prange[1] - Prange[0]) / 2.0 + Prange[0]
             logger.info(
-                "New Max Pressure: {},  Obj. Func: {}, Range {}".format(
-                    Prange[0], ObjRange[0], Prange
-                )
+                "New Max Pressure: %s,  Obj. Func: %s, Range %s",
+                Prange[0],
+                ObjRange[0],
+                Prange,
             )
         else:
             Parray.append(p)
@@ -2113,8 +2918,10 @@ def calc_Prange_yi(
                 ObjRange[1] = obj
 
                 logger.info(
-                    "Maximum Pressure (if it exists) between Pressure: "
-                    + "{} and Obj Range: {}".format(Prange, ObjRange)
+                    "Maximum Pressure (if it exists) between Pressure: %s and Obj "
+                    "Range: %s",
+                    Prange,
+                    ObjRange,
                 )
 
                 P0 = np.mean(Prange)
@@ -2137,9 +2944,10 @@ def calc_Prange_yi(
                     mole_fraction_options=mole_fraction_options,
                 )
                 logger.info(
-                    "New Max Pressure: {}, Obj Func: {}, Range {}".format(
-                        p, obj, Prange
-                    )
+                    "New Max Pressure: %s, Obj Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
 
                 if p < 0:
@@ -2168,19 +2976,20 @@ def calc_Prange_yi(
                         p_min = p_min[obj_tmp == np.nanmin(obj_tmp)]
                     elif len(p_min) == 0:
                         logger.error(
-                            "Could not find minimum in pressure range:\n    "
-                            + "Pressure: {}\n    Obj Value: {}".format(
-                                parray, obj_array
-                            )
+                            "Could not find minimum in pressure range:\n    Pressure: "
+                            "%s\n    Obj Value: %s",
+                            parray,
+                            obj_array,
                         )
                     p = p_min
                     obj = objective_bubble_pressure(
                         p, xi, T, Eos, density_opts=density_opts
                     )
                     logger.info(
-                        "New Max Pressure: {}, Obj Func: {}, Range {}".format(
-                            p, obj, Prange
-                        )
+                        "New Max Pressure: %s, Obj Func: %s, Range %s",
+                        p,
+                        obj,
+                        Prange,
                     )
 
                 if obj > 0:
@@ -2193,27 +3002,31 @@ def calc_Prange_yi(
                     flag_min = False
                 else:
                     logger.error(
-                        "Could not find maximum in pressure range:\n    Pressure "
-                        + "range {} best {}\n    Obj Value range {} best {}".format(
-                            Prange, p, ObjRange, obj
-                        )
+                        "Could not find maximum in pressure range:\n    Pressure range "
+                        "%s best %s\n    Obj Value range %s best %s",
+                        Prange,
+                        p,
+                        ObjRange,
+                        obj,
                     )
                 break
 
             elif flag_hard_max:
                 logger.info(
-                    "New Minimum Pressure: {},  Obj. Func: {}, Range {}".format(
-                        p, obj, Prange
-                    )
+                    "New Minimum Pressure: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 Prange[0] = p
                 ObjRange[0] = obj
                 p = (Prange[1] - Prange[0]) / 2.0 + Prange[0]
             else:
                 logger.info(
-                    "New Maximum Pressure: {},  Obj. Func: {}, Range {}".format(
-                        p, obj, Prange
-                    )
+                    "New Maximum Pressure: %s,  Obj. Func: %s, Range %s",
+                    p,
+                    obj,
+                    Prange,
                 )
                 if not flag_hard_max:
                     if Prange[1] < p:
@@ -2228,25 +3041,25 @@ def calc_Prange_yi(
     if z == maxiter - 1 or flag_min:
         if flag_min:
             logger.error(
-                "Cannot reach objective value of zero. Final Pressure: "
-                + "{}, Obj. Func: {}".format(p, obj)
+                "Cannot reach objective value of zero. Final Pressure: %s, Obj. Func: "
+                "%s",
+                p,
+                obj,
             )
         else:
             logger.error(
                 "Maximum Number of Iterations Reached: A change in sign for the "
-                + "objective function could not be found, inspect progress"
+                "objective function could not be found, inspect progress"
             )
         Prange = np.array([np.nan, np.nan])
         Pguess = np.nan
     elif flag_sol:
-        logger.info(
-            "[Pmin, Pmax]: {}, Obj. Values: {}".format(str(Prange), str(ObjRange))
-        )
-        logger.info("Initial guess in pressure: {} Pa".format(Pguess))
+        logger.info("[Pmin, Pmax]: %s, Obj. Values: %s", str(Prange), str(ObjRange))
+        logger.info("Initial guess in pressure: %s Pa", Pguess)
     else:
         logger.error(
-            "Maximum Number of Iterations Reached: A change in sign for the "
-            + "objective function could not be found, inspect progress"
+            "Maximum Number of Iterations Reached: A change in sign for the objective "
+            "function could not be found, inspect progress"
         )
 
         _xi_global = xi_range
@@ -2326,17 +3139,26 @@ def calc_vapor_composition(
 
     global _yi_global
 
-    yi_total = [np.sum(yi)]
+    # Only the three most recent iteration sums are ever consulted
+    # (convergence and bounce detection), so keep rolling scalars rather
+    # than a growing list
+    yi_sum_prev = float(np.sum(yi))
+    yi_sum_prev2 = yi_sum_prev3 = None
     yi /= np.sum(yi)
+    # xi and phil are fixed in this inner loop, so their product is too
+    xi_phil = np.asarray(xi, dtype=float) * np.asarray(phil, dtype=float)
+    ind_xi = np.asarray(xi, dtype=float) != 0.0
     flag_check_vapor = True  # Make sure we only search for vapor compositions once
     flag_trivial_sol = (
         True  # Make sure we only try to find alternative to trivial solution once
     )
-    logger.info("    Solve yi: P {}, T {}, xi {}, phil {}".format(P, T, xi, phil))
+    step_history = []  # Last (guess, update) pairs for Anderson acceleration
+    logger.info("    Solve yi: P %s, T %s, xi %s, phil %s", P, T, xi, phil)
 
     for z in range(maxiter):
 
-        yi_tmp = yi / np.sum(yi)
+        # yi is kept normalized at the end of each iteration
+        yi_tmp = yi
 
         # Try yi
         phiv, _, flagv = calc_vapor_fugacity_coefficient(
@@ -2344,9 +3166,10 @@ def calc_vapor_composition(
         )
 
         if (
-            any(np.isnan(phiv)) or flagv == 1
+            np.isnan(phiv).any() or flagv == 1
         ) and flag_check_vapor:  # If vapor density doesn't exist
             flag_check_vapor = False
+            step_history = []  # Composition search breaks the iteration history
             if all(yi_tmp != 0.0) and len(yi_tmp) == 2:
                 logger.debug("    Composition doesn't produce a vapor, let's find one!")
                 yi_tmp = find_new_yi(
@@ -2364,16 +3187,17 @@ def calc_vapor_composition(
                     yinew = calc_new_mole_fractions(xi, phil, phiv, phase="vapor")
             else:
                 logger.debug(
-                    "    Composition doesn't produce a vapor, we need a function to"
-                    + " search compositions for more than two components."
+                    "    Composition doesn't produce a vapor, we need a function to "
+                    "search compositions for more than two components."
                 )
                 yinew = yi
-        elif np.sum(np.abs(xi - yi_tmp) / xi) < tol_trivial and flag_trivial_sol:
+        elif np.max(np.abs(xi - yi_tmp) / xi) < tol_trivial and flag_trivial_sol:
             flag_trivial_sol = False
+            step_history = []  # Composition search breaks the iteration history
             if all(yi_tmp != 0.0) and len(yi_tmp) == 2:
                 logger.debug(
-                    "    Composition produces trivial solution, let's find a "
-                    + "different one!"
+                    "    Composition produces trivial solution, let's find a different "
+                    "one!"
                 )
                 yi_tmp = find_new_yi(
                     P, T, phil, xi, Eos, density_opts=density_opts, **kwargs
@@ -2381,8 +3205,8 @@ def calc_vapor_composition(
                 flag_check_vapor = False
             else:
                 logger.debug(
-                    "    Composition produces trivial solution, using random guess"
-                    + " to reset"
+                    "    Composition produces trivial solution, using random guess to "
+                    "reset"
                 )
                 yi_tmp = np.random.rand(len(yi_tmp))
                 yi_tmp /= np.sum(yi_tmp)
@@ -2397,27 +3221,36 @@ def calc_vapor_composition(
                 )
                 yinew = calc_new_mole_fractions(xi, phil, phiv, phase="vapor")
         else:
-            yinew = calc_new_mole_fractions(xi, phil, phiv, phase="vapor")
-
-        yinew[np.isnan(yinew)] = 0.0
-        yi2 = yinew / np.sum(yinew)
-        phiv2, _, flagv2 = calc_vapor_fugacity_coefficient(
-            P, T, yi2, Eos, density_opts=density_opts
-        )
-
-        if any(np.isnan(phiv)):
+            yinew = np.zeros_like(xi_phil)
+            np.divide(xi_phil, phiv, out=yinew, where=ind_xi)
+            step_history.append((yi_tmp, yinew))
+            if len(step_history) > 2:
+                step_history.pop(0)
+
+        # Single C pass, no boolean index array
+        np.nan_to_num(yinew, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+        yinew_sum = float(np.sum(yinew))
+        yi2 = yinew / yinew_sum
+        # Defer the EOS evaluation at the normalized composition; only the
+        # bounce check and the final return actually consume it, so most
+        # iterations never pay for it
+        phiv2, flagv2 = None, None
+
+        if np.isnan(phiv).any():
             phiv = np.nan
             logger.error(
-                "Fugacity coefficient of vapor should not be NaN, pressure could be"
-                + " too high."
+                "Fugacity coefficient of vapor should not be NaN, pressure could be "
+                "too high."
             )
 
         # Check for bouncing between values
-        if len(yi_total) > 3:
-            tmp1 = np.abs(np.sum(yinew) - yi_total[-2]) + np.abs(
-                yi_total[-1] - yi_total[-3]
-            )
-            if tmp1 < np.abs(np.sum(yinew) - yi_total[-1]) and flagv != flagv2:
+        if z > 2:
+            tmp1 = abs(yinew_sum - yi_sum_prev2) + abs(yi_sum_prev - yi_sum_prev3)
+            if tmp1 < abs(yinew_sum - yi_sum_prev):
+                phiv2, _, flagv2 = calc_vapor_fugacity_coefficient(
+                    P, T, yi2, Eos, density_opts=density_opts
+                )
+            if tmp1 < abs(yinew_sum - yi_sum_prev) and flagv != flagv2:
                 logger.debug(
                     "    Composition bouncing between values, let's find the answer!"
                 )
@@ -2430,42 +3263,61 @@ def calc_vapor_composition(
                 )
                 _yi_global = yi2
                 logger.info(
-                    "    Inner Loop Final (from bracketing bouncing values) yi: "
-                    + "{}, Final Error on Smallest Fraction: {}".format(yi2, obj)
+                    "    Inner Loop Final (from bracketing bouncing values) yi: %s, "
+                    "Final Error on Smallest Fraction: %s",
+                    yi2,
+                    obj,
                 )
                 break
 
         logger.debug(
-            "    yi guess {}, yi calc {}, phiv {}, flag {}".format(
-                yi_tmp, yinew, phiv, flagv
-            )
+            "    yi guess %s, yi calc %s, phiv %s, flag %s",
+            yi_tmp,
+            yinew,
+            phiv,
+            flagv,
         )
         logger.debug(
-            "    Old yi_total: {}, New yi_total: {}, Change: {}".format(
-                yi_total[-1], np.sum(yinew), np.sum(yinew) - yi_total[-1]
-            )
+            "    Old yi_total: %s, New yi_total: %s, Change: %s",
+            yi_sum_prev,
+            yinew_sum,
+            yinew_sum - yi_sum_prev,
         )
 
         # Check convergence
-        if abs(np.sum(yinew) - yi_total[-1]) < tol:
-            ind_tmp = np.where(yi_tmp == min(yi_tmp[yi_tmp > 0]))[0]
-            if np.abs(yi2[ind_tmp] - yi_tmp[ind_tmp]) / yi_tmp[ind_tmp] < tol:
+        if abs(yinew_sum - yi_sum_prev) < tol:
+            ind_tmp = np.argmin(np.where(yi_tmp > 0, yi_tmp, np.inf))
+            # Plain float arithmetic; numpy kernel launches cost more than
+            # the math for these scalars
+            err_tmp = abs(float(yi2[ind_tmp]) - float(yi_tmp[ind_tmp])) / float(
+                yi_tmp[ind_tmp]
+            )
+            if err_tmp < tol:
                 _yi_global = yi2
                 logger.info(
-                    "    Inner Loop Final yi: "
-                    + "{}, Final Error on Smallest Fraction: {}%".format(
-                        yi2,
-                        np.abs(yi2[ind_tmp] - yi_tmp[ind_tmp]) / yi_tmp[ind_tmp] * 100,
-                    )
+                    "    Inner Loop Final yi: %s, Final Error on Smallest Fraction: %s %%",
+                    yi2,
+                    err_tmp * 100,
                 )
                 break
 
         if z < maxiter - 1:
-            yi_total.append(np.sum(yinew))
-            yi = yinew
+            yi_sum_prev3, yi_sum_prev2, yi_sum_prev = (
+                yi_sum_prev2,
+                yi_sum_prev,
+                yinew_sum,
+            )
+            yi = yi2
+            if len(step_history) == 2:
+                yi_accelerated = _anderson_accelerated_step(step_history)
+                if yi_accelerated is not None:
+                    logger.debug(
+                        "    Anderson accelerated yi guess: %s", yi_accelerated
+                    )
+                    yi = yi_accelerated / np.sum(yi_accelerated)
 
     # If yi wasn't found in defined number of iterations
-    ind_tmp = np.where(yi_tmp == min(yi_tmp[yi_tmp > 0.0]))[0]
+    ind_tmp = np.argmin(np.where(yi_tmp > 0.0, yi_tmp, np.inf))
     if flagv == 3:
         yi2 = yinew / np.sum(yinew)
         logger.info("    Could not converged mole fraction")
@@ -2475,34 +3327,42 @@ def calc_vapor_composition(
         yi2 = yinew / np.sum(yinew)
         tmp = np.abs(yi2[ind_tmp] - yi_tmp[ind_tmp]) / yi_tmp[ind_tmp]
         logger.warning(
-            "    More than {} iterations needed.".format(maxiter)
-            + " Error in Smallest Fraction: {}%".format(tmp * 100)
+            "    More than %s iterations needed. Error in Smallest Fraction: %s %%",
+            maxiter,
+            tmp * 100,
         )
         if tmp > 0.1:  # If difference is greater than 10%
             yinew = find_new_yi(
                 P, T, phil, xi, Eos, density_opts=density_opts, **kwargs
             )
             yi2 = yinew / np.sum(yinew)
-        y1 = spo.least_squares(
+        # The objective is an unsigned residual, so use the bounded Brent
+        # minimizer; a trust-region least-squares solver would spend extra
+        # EOS calls finite-differencing a 1x1 Jacobian
+        y1 = spo.minimize_scalar(
             objective_find_yi,
-            yi2[0],
             bounds=(0.0, 1.0),
             args=(P, T, phil, xi, Eos, density_opts),
+            method="bounded",
         )
-        yi = y1.x[0]
+        yi = y1.x
         yi2 = np.array([yi, 1 - yi])
         phiv2, _, flagv2 = calc_vapor_fugacity_coefficient(
             P, T, yi2, Eos, density_opts=density_opts
         )
         obj = objective_find_yi(yi2, P, T, phil, xi, Eos, density_opts=density_opts)
-        logger.warning(
-            "    Find yi with root algorithm, yi {}, obj {}".format(yi2, obj)
-        )
+        logger.warning("    Find yi with root algorithm, yi %s, obj %s", yi2, obj)
         if obj > tol:
             logger.error("Could not converge mole fraction")
             phiv2 = np.full(len(yi_tmp), np.nan)
             flagv2 = 3
 
+    if phiv2 is None:
+        # Materialize the deferred evaluation at the converged composition
+        phiv2, _, flagv2 = calc_vapor_fugacity_coefficient(
+            P, T, yi2, Eos, density_opts=density_opts
+        )
+
     return yi2, phiv2, flagv2
 
 
@@ -2578,24 +3438,31 @@ def calc_liquid_composition(
         )
 
     xi /= np.sum(xi)
-    xi_total = [np.sum(xi)]
+    # Only the previous iteration sum is ever consulted, keep a scalar
+    xi_sum_prev = float(np.sum(xi))
+    # yi and phiv are fixed in this inner loop, so their product is too
+    yi_phiv = np.asarray(yi, dtype=float) * np.asarray(phiv, dtype=float)
+    ind_yi = np.asarray(yi, dtype=float) != 0.0
     flag_check_liquid = True  # Make sure we only search for liquid compositions once
     flag_trivial_sol = (
         True  # Make sure we only try to find alternative to trivial solution once
     )
-    logger.info("    Solve xi: P {}, T {}, yi {}, phiv {}".format(P, T, yi, phiv))
+    step_history = []  # Last (guess, update) pairs for Anderson acceleration
+    logger.info("    Solve xi: P %s, T %s, yi %s, phiv %s", P, T, yi, phiv)
 
     for z in range(maxiter):
 
-        xi_tmp = xi / np.sum(xi)
+        # xi is kept normalized at the end of each iteration
+        xi_tmp = xi
 
         # Try xi
         phil, rhol, flagl = calc_liquid_fugacity_coefficient(
             P, T, xi_tmp, Eos, density_opts=density_opts
         )
 
-        if (any(np.isnan(phil)) or flagl in [0, 4]) and flag_check_liquid:
+        if (np.isnan(phil).any() or flagl in [0, 4]) and flag_check_liquid:
             flag_check_liquid = False
+            step_history = []  # Composition search breaks the iteration history
             if all(xi_tmp != 0.0) and len(xi_tmp) == 2:
                 logger.debug(
                     "    Composition doesn't produce a liquid, let's find one!"
@@ -2615,16 +3482,17 @@ def calc_liquid_composition(
                     xinew = calc_new_mole_fractions(yi, phil, phiv, phase="liquid")
             else:
                 logger.debug(
-                    "    Composition doesn't produce a liquid, we need a function"
-                    + " to search compositions for more than two components."
+                    "    Composition doesn't produce a liquid, we need a function to "
+                    "search compositions for more than two components."
                 )
                 xinew = xi
-        elif np.sum(np.abs(yi - xi_tmp) / yi) < tol_trivial and flag_trivial_sol:
+        elif np.max(np.abs(yi - xi_tmp) / yi) < tol_trivial and flag_trivial_sol:
             flag_trivial_sol = False
+            step_history = []  # Composition search breaks the iteration history
             if all(xi_tmp != 0.0) and len(xi_tmp) == 2:
                 logger.debug(
-                    "    Composition produces trivial solution, let's find a"
-                    + " different one!"
+                    "    Composition produces trivial solution, let's find a different "
+                    "one!"
                 )
                 xi_tmp = find_new_xi(
                     P, T, phiv, yi, Eos, density_opts=density_opts, **kwargs
@@ -2632,8 +3500,8 @@ def calc_liquid_composition(
                 flag_check_liquid = False
             else:
                 logger.debug(
-                    "    Composition produces trivial solution, using random guess"
-                    + " to reset"
+                    "    Composition produces trivial solution, using random guess to "
+                    "reset"
                 )
                 xi_tmp = np.random.rand(len(xi_tmp))
                 xi_tmp /= np.sum(xi_tmp)
@@ -2648,63 +3516,84 @@ def calc_liquid_composition(
                 )
                 xinew = calc_new_mole_fractions(yi, phil, phiv, phase="liquid")
         else:
-            xinew = calc_new_mole_fractions(yi, phil, phiv, phase="liquid")
-        xinew[np.isnan(xinew)] = 0.0
+            xinew = np.zeros_like(yi_phiv)
+            np.divide(yi_phiv, phil, out=xinew, where=ind_yi)
+            step_history.append((xi_tmp, xinew))
+            if len(step_history) > 2:
+                step_history.pop(0)
+        # Single C pass, no boolean index array
+        np.nan_to_num(xinew, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+        xinew_sum = float(np.sum(xinew))
 
         logger.debug(
-            "    xi guess {}, xi calc {}, phil {}".format(
-                xi_tmp, xinew / np.sum(xinew), phil
-            )
+            "    xi guess %s, xi calc %s, phil %s",
+            xi_tmp,
+            xinew / xinew_sum,
+            phil,
         )
         logger.debug(
-            "    Old xi_total: {}, New xi_total: {}, Change: {}".format(
-                xi_total[-1], np.sum(xinew), np.sum(xinew) - xi_total[-1]
-            )
+            "    Old xi_total: %s, New xi_total: %s, Change: %s",
+            xi_sum_prev,
+            xinew_sum,
+            xinew_sum - xi_sum_prev,
         )
 
         # Check convergence
-        if abs(np.sum(xinew) - xi_total[-1]) < tol:
-            ind_tmp = np.where(xi_tmp == min(xi_tmp[xi_tmp > 0]))[0]
-            xi2 = xinew / np.sum(xinew)
-            if np.abs(xi2[ind_tmp] - xi_tmp[ind_tmp]) / xi_tmp[ind_tmp] < tol:
+        if abs(xinew_sum - xi_sum_prev) < tol:
+            ind_tmp = np.argmin(np.where(xi_tmp > 0, xi_tmp, np.inf))
+            xi2 = xinew / xinew_sum
+            # Plain float arithmetic; numpy kernel launches cost more than
+            # the math for these scalars
+            err_tmp = abs(float(xi2[ind_tmp]) - float(xi_tmp[ind_tmp])) / float(
+                xi_tmp[ind_tmp]
+            )
+            if err_tmp < tol:
                 _xi_global = xi2
                 logger.info(
-                    "    Inner Loop Final xi: {}, Final".format(xi2)
-                    + " Error on Smallest Fraction: {}%".format(
-                        np.abs(xi2[ind_tmp] - xi_tmp[ind_tmp]) / xi_tmp[ind_tmp] * 100,
-                    )
+                    "    Inner Loop Final xi: %s, Final Error on Smallest Fraction: %s %%",
+                    xi2,
+                    err_tmp * 100,
                 )
                 break
 
         if z < maxiter - 1:
-            xi_total.append(np.sum(xinew))
-            xi = xinew
+            xi_sum_prev = xinew_sum
+            xi = xinew / xinew_sum
+            if len(step_history) == 2:
+                xi_accelerated = _anderson_accelerated_step(step_history)
+                if xi_accelerated is not None:
+                    logger.debug(
+                        "    Anderson accelerated xi guess: %s", xi_accelerated
+                    )
+                    xi = xi_accelerated / np.sum(xi_accelerated)
 
     xi2 = xinew / np.sum(xinew)
 
-    ind_tmp = np.where(xi_tmp == min(xi_tmp[xi_tmp > 0]))[0]
+    ind_tmp = np.argmin(np.where(xi_tmp > 0, xi_tmp, np.inf))
     if z == maxiter - 1:
         tmp = np.abs(xi2[ind_tmp] - xi_tmp[ind_tmp]) / xi_tmp[ind_tmp]
         logger.warning(
-            "    More than {} iterations needed. ".format(maxiter)
-            + "Error in Smallest Fraction: {} %%".format(tmp * 100)
+            "    More than %s iterations needed. Error in Smallest Fraction: %s %%",
+            maxiter,
+            tmp * 100,
         )
         if tmp > 0.1:  # If difference is greater than 10%
             xinew = find_new_xi(
                 P, T, phiv, yi, Eos, density_opts=density_opts, **kwargs
             )
-        xinew = spo.least_squares(
+        # The objective is an unsigned residual, so use the bounded Brent
+        # minimizer; a trust-region least-squares solver would spend extra
+        # EOS calls finite-differencing a 1x1 Jacobian
+        xinew = spo.minimize_scalar(
             objective_find_xi,
-            xinew[0],
             bounds=(0.0, 1.0),
             args=(P, T, phiv, yi, Eos, density_opts),
+            method="bounded",
         )
-        xi = xinew.x[0]
+        xi = xinew.x
         xi_tmp = np.array([xi, 1 - xi])
         obj = objective_find_xi(xi_tmp, P, T, phiv, yi, Eos, density_opts=density_opts)
-        logger.warning(
-            "    Find xi with root algorithm, xi {}, obj {}".format(xi_tmp, obj)
-        )
+        logger.warning("    Find xi with root algorithm, xi %s, obj %s", xi_tmp, obj)
 
     return xi_tmp, phil, flagl
 
@@ -2746,31 +3635,32 @@ def find_new_yi(
 
     if len(kwargs) > 0:
         logger.debug(
-            "    'find_new_yi' does not use the following keyword arguments:"
-            + " {}".format(", ".join(list(kwargs.keys())))
+            "    'find_new_yi' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     yi_ext = np.linspace(bounds[0], bounds[1], npoints)  # Guess for yi
     obj_ext = np.zeros(len(yi_ext))
     flag_ext = np.zeros(len(yi_ext))
 
-    for i, yi in enumerate(yi_ext):
-        yi = np.array([yi, 1 - yi])
-        obj, flagv = objective_find_yi(
+    # Build all compositions up front; each row still needs its own density
+    # solve since the EOS evaluates one composition at a time
+    Yi = np.column_stack((yi_ext, 1.0 - yi_ext))
+    for i, yi in enumerate(Yi):
+        obj_ext[i], flag_ext[i] = objective_find_yi(
             yi, P, T, phil, xi, Eos, density_opts=density_opts, return_flag=True
         )
-        flag_ext[i] = flagv
-        obj_ext[i] = obj
 
-    tmp = np.count_nonzero(~np.isnan(obj_ext))
-    logger.debug("    Number of valid mole fractions: {}".format(tmp))
+    ind_valid = ~np.isnan(obj_ext)
+    tmp = np.count_nonzero(ind_valid)
+    logger.debug("    Number of valid mole fractions: %s", tmp)
     if tmp == 0:
         yi_final = np.nan
         obj_final = np.nan
     else:
         # Remove any NaN
-        obj_tmp = obj_ext[~np.isnan(obj_ext)]
-        yi_tmp = yi_ext[~np.isnan(obj_ext)]
+        obj_tmp = obj_ext[ind_valid]
+        yi_tmp = yi_ext[ind_valid]
 
         # Fit spline
         spline = interpolate.Akima1DInterpolator(yi_tmp, obj_tmp)
@@ -2780,27 +3670,26 @@ def find_new_yi(
 
             # Remove local maxima
             yi_concav = spline.derivative(nu=2)(yi_min)
-            yi_min = [yi_min[i] for i in range(len(yi_min)) if yi_concav[i] > 0.0]
+            yi_min = yi_min[yi_concav > 0.0]
 
             # Add end points if relevant
             if len(yi_tmp) > 1:
                 if obj_tmp[0] < obj_tmp[1]:
-                    yi_min.insert(0, yi_tmp[0])
+                    yi_min = np.insert(yi_min, 0, yi_tmp[0])
                 if obj_tmp[-1] < obj_tmp[-2]:
-                    yi_min.append(yi_tmp[-1])
-            yi_min = np.array(yi_min)
+                    yi_min = np.append(yi_min, yi_tmp[-1])
 
             # Remove trivial solution
             obj_trivial = np.abs(yi_min - xi[0]) / xi[0]
-            ind = np.where(obj_trivial == min(obj_trivial))[0][0]
+            ind = np.argmin(obj_trivial)
             logger.debug(
-                "    Found multiple minima: {}, discard {} as trivial solution".format(
-                    yi_min, yi_min[ind]
-                )
+                "    Found multiple minima: %s, discard %s as trivial solution",
+                yi_min,
+                yi_min[ind],
             )
 
             # Remove liquid roots
-            yi_min = np.array([yi_min[ii] for ii in range(len(yi_min)) if ii != ind])
+            yi_min = np.delete(yi_min, ind)
             if len(yi_min) > 1:
                 lyi = len(yi_min)
                 obj_tmp2 = np.zeros(lyi)
@@ -2816,29 +3705,22 @@ def find_new_yi(
                         density_opts=density_opts,
                         return_flag=True,
                     )
-                yi_tmp2 = [
-                    yi_min[ii] for ii in range(len(yi_min)) if flagv_tmp2[ii] != 1
-                ]
-                if len(yi_tmp2):
-                    obj_tmp2 = [
-                        obj_tmp2[ii]
-                        for ii in range(len(obj_tmp2))
-                        if flagv_tmp2[ii] != 1
-                    ]
-                    yi_min = [yi_tmp2[np.where(obj_tmp2 == min(obj_tmp2))[0][0]]]
+                ind_vapor = flagv_tmp2 != 1
+                if np.any(ind_vapor):
+                    yi_min = [yi_min[ind_vapor][np.argmin(obj_tmp2[ind_vapor])]]
                 else:
-                    yi_min = [yi_min[np.where(obj_tmp2 == min(obj_tmp2))[0][0]]]
+                    yi_min = [yi_min[np.argmin(obj_tmp2)]]
 
         if not len(yi_min):
             # Choose values with lowest objective function
-            ind = np.where(np.abs(obj_tmp) == min(np.abs(obj_tmp)))[0][0]
+            ind = np.argmin(np.abs(obj_tmp))
             obj_final = obj_tmp[ind]
             yi_final = yi_tmp[ind]
         else:
             yi_final = yi_min[0]
             obj_final = spline(yi_min[0])
 
-    logger.debug("    Found new guess in yi: {}, Obj: {}".format(yi_final, obj_final))
+    logger.debug("    Found new guess in yi: %s, Obj: %s", yi_final, obj_final)
     if not gtb.isiterable(yi_final):
         yi_final = np.array([yi_final, 1 - yi_final])
 
@@ -2896,83 +3778,93 @@ def bracket_bounding_yi(
     if len(kwargs) > 0:
         logger.debug(
             "    'calc_saturation_properties' does not use the following keyword "
-            "arguments: {}".format(", ".join(list(kwargs.keys())))
+            "arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     if np.size(bounds) != 2:
         raise ValueError("Given bounds on y1 must be of length two.")
 
-    bounds = np.array(bounds)
-    obj_bounds = np.zeros(2)
-    flag_bounds = np.zeros(2)
-    obj_bounds[0], flag_bounds[0] = objective_find_yi(
-        bounds[0], P, T, phil, xi, Eos, density_opts=density_opts, return_flag=True
+    # Scalar bookkeeping; two-element arrays would pay numpy allocation and
+    # fancy-indexing overhead on every bisection step
+    bound0, bound1 = float(bounds[0]), float(bounds[1])
+    obj_bound0, flag_bound0 = objective_find_yi(
+        bound0, P, T, phil, xi, Eos, density_opts=density_opts, return_flag=True
     )
-    obj_bounds[1], flag_bounds[1] = objective_find_yi(
-        bounds[1], P, T, phil, xi, Eos, density_opts=density_opts, return_flag=True
+    obj_bound1, flag_bound1 = objective_find_yi(
+        bound1, P, T, phil, xi, Eos, density_opts=density_opts, return_flag=True
     )
 
-    if flag_bounds[0] == flag_bounds[1]:
+    if flag_bound0 == flag_bound1:
         logger.error(
-            "    Both mole fractions have flag, "
-            + "{}, continue seeking convergence".format(flag_bounds[0])
+            "    Both mole fractions have flag, %s, continue seeking convergence",
+            flag_bound0,
         )
-        y1 = bounds[1]
-        flagv = flag_bounds[1]
+        y1 = bound1
+        flagv = flag_bound1
 
     else:
         flag_high_vapor = False
-        for i in np.arange(maxiter):
+        for i in range(maxiter):
 
-            y1 = np.mean(bounds)
+            y1 = 0.5 * (bound0 + bound1)
             obj, flagv = objective_find_yi(
                 y1, P, T, phil, xi, Eos, density_opts=density_opts, return_flag=True
             )
 
             if not flag_high_vapor:
-                ind = np.where(flag_bounds == flagv)[0][0]
+                ind = 0 if flag_bound0 == flagv else 1
                 if flagv == 0 and obj > 1 / tol:
                     flag_high_vapor = True
-                    bounds[0], obj_bounds[0], flag_bounds[0] = (
-                        bounds[ind],
-                        obj_bounds[ind],
-                        flag_bounds[ind],
-                    )
+                    if ind == 1:
+                        bound0, obj_bound0, flag_bound0 = (
+                            bound1,
+                            obj_bound1,
+                            flag_bound1,
+                        )
                     ind = 1
             else:
-                if obj < obj_bounds[0]:
-                    ind = 0
-                else:
-                    ind = 1
+                ind = 0 if obj < obj_bound0 else 1
 
-            bounds[ind], obj_bounds[ind], flag_bounds[ind] = y1, obj, flagv
+            if ind == 0:
+                bound0, obj_bound0, flag_bound0 = y1, obj, flagv
+            else:
+                bound1, obj_bound1, flag_bound1 = y1, obj, flagv
             logger.debug(
-                "    Bouncing mole fraction new bounds: {}, obj: {}, flag: {}".format(
-                    bounds, obj_bounds, flag_bounds
-                )
+                "    Bouncing mole fraction new bounds: [%s, %s], obj: [%s, %s], "
+                "flag: [%s, %s]",
+                bound0,
+                bound1,
+                obj_bound0,
+                obj_bound1,
+                flag_bound0,
+                flag_bound1,
             )
 
             # Check convergence
-            if np.abs(bounds[1] - bounds[0]) < tol:
+            if abs(bound1 - bound0) < tol:
                 break
 
-        ind_array = np.where(flag_bounds == 0)[0]
-        if np.size(ind_array) == 1:
-            ind = ind_array[0]
+        if (flag_bound0 == 0) != (flag_bound1 == 0):
+            ind = 0 if flag_bound0 == 0 else 1
         else:
-            ind = np.where(obj_bounds == np.min(obj_bounds))[0][0]
+            ind = 0 if obj_bound0 <= obj_bound1 else 1
 
-        y1, flagv = bounds[ind], flag_bounds[ind]
+        if ind == 0:
+            y1, flagv = bound0, flag_bound0
+        else:
+            y1, flagv = bound1, flag_bound1
         if i == maxiter - 1:
             logger.debug(
-                "    Bouncing mole fraction, max iterations ended with, "
-                + "y1={}, flagv={}".format(y1, flagv)
+                "    Bouncing mole fraction, max iterations ended with, y1=%s, flagv=%s",
+                y1,
+                flagv,
             )
         else:
             logger.debug(
-                "    Bouncing mole fractions converged to y1={}, flagv={}".format(
-                    y1, flagv
-                )
+                "    Bouncing mole fractions converged to y1=%s, flagv=%s",
+                y1,
+                flagv,
             )
 
     return np.array([y1, 1 - y1]), flagv
@@ -3026,6 +3918,15 @@ def objective_find_yi(yi, P, T, phil, xi, Eos, density_opts={}, return_flag=Fals
         P, T, yi, Eos, density_opts=density_opts
     )
 
+    # Without a fluid root the residual can only come out NaN; return it
+    # before spending work on the composition update
+    if flagv == 3 or np.any(np.isnan(phiv)):
+        logger.debug("    Guess yi: %s, no valid root, flagv %s", yi, flagv)
+        if return_flag:
+            return np.nan, flagv
+        else:
+            return np.nan
+
     yinew = calc_new_mole_fractions(xi, phil, phiv, phase="vapor")
     yi2 = yinew / np.sum(yinew)
 
@@ -3035,10 +3936,16 @@ def objective_find_yi(yi, P, T, phil, xi, Eos, density_opts={}, return_flag=Fals
         phiv2, _, flagv2 = calc_vapor_fugacity_coefficient(
             P, T, yi2, Eos, density_opts=density_opts
         )
-        obj = np.sum(np.abs(yinew - xi * phil / phiv2))
+        # xi and phil are fixed for this objective, so form the product once
+        xi_phil = xi * phil
+        obj = np.sum(np.abs(yinew - xi_phil / phiv2))
 
     logger.debug(
-        "    Guess yi: {}, calc yi: {}, diff={}, flagv {}".format(yi, yi2, obj, flagv)
+        "    Guess yi: %s, calc yi: %s, diff=%s, flagv %s",
+        yi,
+        yi2,
+        obj,
+        flagv,
     )
 
     if return_flag:
@@ -3083,32 +3990,32 @@ def find_new_xi(
 
     if len(kwargs) > 0:
         logger.debug(
-            "    'find_new_xi' does not use the following keyword arguments: {}".format(
-                ", ".join(list(kwargs.keys()))
-            )
+            "    'find_new_xi' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     xi_ext = np.linspace(bounds[0], bounds[1], npoints)  # Guess for yi
     obj_ext = np.zeros(len(xi_ext))
     flag_ext = np.zeros(len(xi_ext))
 
-    for i, xi in enumerate(xi_ext):
-        xi = np.array([xi, 1 - xi])
-        obj, flagl = objective_find_xi(
+    # Build all compositions up front; each row still needs its own density
+    # solve since the EOS evaluates one composition at a time
+    Xi = np.column_stack((xi_ext, 1.0 - xi_ext))
+    for i, xi in enumerate(Xi):
+        obj_ext[i], flag_ext[i] = objective_find_xi(
             xi, P, T, phiv, yi, Eos, density_opts=density_opts, return_flag=True
         )
-        flag_ext[i] = flagl
-        obj_ext[i] = obj
 
-    tmp = np.count_nonzero(~np.isnan(obj_ext))
-    logger.debug("    Number of valid mole fractions: {}".format(tmp))
+    ind_valid = ~np.isnan(obj_ext)
+    tmp = np.count_nonzero(ind_valid)
+    logger.debug("    Number of valid mole fractions: %s", tmp)
     if tmp == 0:
         xi_final = np.nan
         obj_final = np.nan
     else:
         # Remove any NaN
-        obj_tmp = obj_ext[~np.isnan(obj_ext)]
-        xi_tmp = xi_ext[~np.isnan(obj_ext)]
+        obj_tmp = obj_ext[ind_valid]
+        xi_tmp = xi_ext[ind_valid]
 
         spline = interpolate.Akima1DInterpolator(xi_tmp, obj_tmp)
         xi_min = spline.derivative().roots()
@@ -3117,34 +4024,33 @@ def find_new_xi(
 
             # Remove local maxima
             xi_concav = spline.derivative(nu=2)(xi_min)
-            xi_min = [xi_min[i] for i in range(len(xi_min)) if xi_concav[i] > 0.0]
+            xi_min = xi_min[xi_concav > 0.0]
             # Add end points if relevant
             if len(xi_tmp) > 1:
                 if obj_tmp[0] < obj_tmp[1]:
-                    xi_min.insert(0, xi_tmp[0])
+                    xi_min = np.insert(xi_min, 0, xi_tmp[0])
                 if obj_tmp[-1] < obj_tmp[-2]:
-                    xi_min.append(xi_tmp[-1])
-            xi_min = np.array(xi_min)
+                    xi_min = np.append(xi_min, xi_tmp[-1])
             # Remove trivial solution
             obj_trivial = np.abs(xi_min - yi[0]) / yi[0]
-            ind = np.where(obj_trivial == min(obj_trivial))[0][0]
+            ind = np.argmin(obj_trivial)
             logger.debug(
-                "    Found multiple minima: {}, discard {} as trivial solution".format(
-                    xi_min, xi_min[ind]
-                )
+                "    Found multiple minima: %s, discard %s as trivial solution",
+                xi_min,
+                xi_min[ind],
             )
-            xi_min = np.array([xi_min[ii] for ii in range(len(xi_min)) if ii != ind])
+            xi_min = np.delete(xi_min, ind)
 
         if not len(xi_min):
             # Choose values with lowest objective function
-            ind = np.where(np.abs(obj_tmp) == min(np.abs(obj_tmp)))[0][0]
+            ind = np.argmin(np.abs(obj_tmp))
             obj_final = obj_tmp[ind]
             xi_final = xi_tmp[ind]
         else:
             xi_final = xi_min[0]
             obj_final = spline(xi_min[0])
 
-    logger.debug("    Found new guess in xi: {}, Obj: {}".format(xi_final, obj_final))
+    logger.debug("    Found new guess in xi: %s, Obj: %s", xi_final, obj_final)
     if not gtb.isiterable(xi_final):
         xi_final = np.array([xi_final, 1 - xi_final])
 
@@ -3199,6 +4105,15 @@ def objective_find_xi(xi, P, T, phiv, yi, Eos, density_opts={}, return_flag=Fals
         P, T, xi, Eos, density_opts=density_opts
     )
 
+    # Without a fluid root the residual can only come out NaN; return it
+    # before spending work on the composition update
+    if flagl == 3 or np.any(np.isnan(phil)):
+        logger.debug("    Guess xi: %s, no valid root, flagl %s", xi, flagl)
+        if return_flag:
+            return np.nan, flagl
+        else:
+            return np.nan
+
     xinew = calc_new_mole_fractions(yi, phil, phiv, phase="liquid")
     xi2 = xinew / np.sum(xinew)
 
@@ -3211,7 +4126,11 @@ def objective_find_xi(xi, P, T, phiv, yi, Eos, density_opts={}, return_flag=Fals
         obj = np.sum(np.abs(xinew - xi * phiv / phil2))
 
     logger.debug(
-        "    Guess xi: {}, calc xi: {}, diff={}, flagl {}".format(xi, xi2, obj, flagl)
+        "    Guess xi: %s, calc xi: %s, diff=%s, flagl %s",
+        xi,
+        xi2,
+        obj,
+        flagl,
     )
 
     if return_flag:
@@ -3251,16 +4170,18 @@ def objective_bubble_pressure(
 
     if len(kwargs) > 0:
         logger.debug(
-            "'objective_bubble_pressure' does not use the following keyword "
-            "arguments: {}".format(", ".join(list(kwargs.keys())))
+            "'objective_bubble_pressure' does not use the following keyword arguments: "
+            "%s",
+            ", ".join(list(kwargs.keys())),
         )
 
-    global _yi_global
+    global _yi_global, _phase_flags_global
 
     if P < 0:
+        _phase_flags_global = (None, None)
         return 10.0
 
-    logger.info("P Guess: {} Pa".format(P))
+    logger.info("P Guess: %s Pa", P)
 
     # find liquid density
     phil, rhol, flagl = calc_liquid_fugacity_coefficient(
@@ -3283,10 +4204,12 @@ def objective_bubble_pressure(
     phiv, rhov, flagv = calc_vapor_fugacity_coefficient(
         P, T, _yi_global, Eos, density_opts=density_opts
     )
+    # Share the phase flags so callers don't repeat the density solves
+    _phase_flags_global = (flagl, flagv)
 
     Pv_test = Eos.pressure(rhov, T, _yi_global)
     obj_value = equilibrium_objective(xi, phil, phiv, phase="vapor")
-    logger.info("Obj Func: {}, Pset: {}, Pcalc: {}".format(obj_value, P, Pv_test[0]))
+    logger.info("Obj Func: %s, Pset: %s, Pcalc: %s", obj_value, P, Pv_test[0])
 
     return obj_value
 
@@ -3322,16 +4245,17 @@ def objective_dew_pressure(
 
     if len(kwargs) > 0:
         logger.debug(
-            "'objective_dew_pressure' does not use the following keyword "
-            + "arguments: {}".format(", ".join(list(kwargs.keys())))
+            "'objective_dew_pressure' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
-    global _xi_global
+    global _xi_global, _phase_flags_global
 
     if P < 0:
+        _phase_flags_global = (None, None)
         return 10.0
 
-    logger.info("P Guess: {} Pa".format(P))
+    logger.info("P Guess: %s Pa", P)
 
     # find liquid density
     phiv, rhov, flagv = calc_vapor_fugacity_coefficient(
@@ -3354,10 +4278,12 @@ def objective_dew_pressure(
     phil, rhol, flagl = calc_liquid_fugacity_coefficient(
         P, T, _xi_global, Eos, density_opts=density_opts
     )
+    # Share the phase flags so callers don't repeat the density solves
+    _phase_flags_global = (flagl, flagv)
 
     Pv_test = Eos.pressure(rhol, T, _xi_global)
     obj_value = equilibrium_objective(yi, phil, phiv, phase="liquid")
-    logger.info("Obj Func: {}, Pset: {}, Pcalc: {}".format(obj_value, P, Pv_test[0]))
+    logger.info("Obj Func: %s, Pset: %s, Pcalc: %s", obj_value, P, Pv_test[0])
 
     return obj_value
 
@@ -3426,16 +4352,17 @@ def calc_dew_pressure(
 
     if len(kwargs) > 0:
         logger.debug(
-            "'calc_dew_pressure' does not use the following keyword arguments: "
-            + "{}".format(", ".join(list(kwargs.keys())))
+            "'calc_dew_pressure' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     global _xi_global
 
     # Estimate pure component vapor pressures
     Psat = np.zeros_like(yi)
+    yi_tmp = np.zeros_like(yi)
     for i in range(np.size(yi)):
-        yi_tmp = np.zeros_like(yi)
+        yi_tmp.fill(0.0)
         yi_tmp[i] = 1.0
         Psat[i], _, _ = calc_saturation_properties(
             T, yi_tmp, Eos, density_opts=density_opts, **kwargs
@@ -3443,22 +4370,32 @@ def calc_dew_pressure(
         if np.isnan(Psat[i]):
             Psat[i] = Psat_set
             logger.warning(
-                "Component, {}, is above its critical point. Psat is".format(i + 1)
-                + " assumed to be {}.".format(Psat[i])
+                "Component, %s, is above its critical point. Psat is assumed to be %s.",
+                i + 1,
+                Psat[i],
             )
 
-    # Estimate initial pressure
+    # Estimate initial pressure, reusing the reciprocal for the xi estimate
+    inv_Psat = np.reciprocal(Psat)
     if Pguess is None:
-        P = 1.0 / np.sum(yi / Psat)
+        P = 1.0 / np.dot(yi, inv_Psat)
     else:
         P = Pguess
 
     # Estimate initial xi
-    if "_xi_global" not in globals() or any(np.isnan(_xi_global)):
-        _xi_global = P * (yi / Psat)
-        _xi_global /= np.sum(_xi_global)
-        _xi_global = copy.deepcopy(_xi_global)
-        logger.info("Guess xi in calc_dew_pressure with Psat: {}".format(_xi_global))
+    if _xi_global is None or np.isnan(_xi_global).any():
+        previous = _recall_composition_guess("dew", yi, Eos)
+        if previous is not None:
+            _xi_global = previous[1].copy()
+            logger.info(
+                "Guess xi in calc_dew_pressure from previous solution at T=%s: %s",
+                previous[0],
+                _xi_global,
+            )
+        else:
+            _xi_global = (P * yi) * inv_Psat
+            _xi_global /= np.sum(_xi_global)
+            logger.info("Guess xi in calc_dew_pressure with Psat: %s", _xi_global)
     xi = _xi_global
 
     Prange, Pestimate = calc_Prange_yi(
@@ -3479,15 +4416,18 @@ def calc_dew_pressure(
         if Pguess is not None:
             if Pguess > Prange[1] or Pguess < Prange[0]:
                 logger.warning(
-                    "Given guess in pressure, {}, is outside of the ".format(Pguess)
-                    + "identified pressure range, "
-                    + "{}. Using estimated pressure, {}.".format(Prange, Pestimate)
+                    "Given guess in pressure, %s, is outside of the identified "
+                    "pressure range, %s. Using estimated pressure, %s.",
+                    Pguess,
+                    Prange,
+                    Pestimate,
                 )
                 P = Pestimate
             else:
                 logger.warning(
-                    "Using given guess in pressure, {},".format(Pguess)
-                    + " that is inside identified pressure range."
+                    "Using given guess in pressure, %s, that is inside identified "
+                    "pressure range.",
+                    Pguess,
                 )
                 P = Pguess
         else:
@@ -3501,17 +4441,12 @@ def calc_dew_pressure(
             options=pressure_options,
         )
 
-    # find vapor density and fugacity
-    phiv, rhov, flagv = calc_vapor_fugacity_coefficient(
-        P, T, yi, Eos, density_opts=density_opts
-    )
-    phil, rhol, flagl = calc_liquid_fugacity_coefficient(
-        P, T, xi, Eos, density_opts=density_opts
-    )
     if "tol" in mole_fraction_options:
         if mole_fraction_options["tol"] > 1e-10:
             mole_fraction_options["tol"] = 1e-10
 
+    # The objective solves both phase densities already, so take the phase
+    # flags from there instead of repeating the density solves
     obj = objective_dew_pressure(
         P,
         yi,
@@ -3520,13 +4455,18 @@ def calc_dew_pressure(
         density_opts=density_opts,
         mole_fraction_options=mole_fraction_options,
     )
+    flagl, flagv = _phase_flags_global
 
     logger.info(
-        "Final Output: Obj {}, P {} Pa, flagl {}, xi {}".format(
-            obj, P, flagl, _xi_global
-        )
+        "Final Output: Obj %s, P %s Pa, flagl %s, xi %s",
+        obj,
+        P,
+        flagl,
+        _xi_global,
     )
 
+    _store_composition_guess("dew", yi, Eos, T, _xi_global)
+
     return P, xi, flagl, flagv, obj
 
 
@@ -3595,15 +4535,16 @@ def calc_bubble_pressure(
 
     if len(kwargs) > 0:
         logger.debug(
-            "'calc_bubble_pressure' does not use the following keyword arguments: "
-            + "{}".format(", ".join(list(kwargs.keys())))
+            "'calc_bubble_pressure' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     global _yi_global
 
     Psat = np.zeros_like(xi)
+    xi_tmp = np.zeros_like(xi)
     for i in range(np.size(xi)):
-        xi_tmp = np.zeros_like(xi)
+        xi_tmp.fill(0.0)
         xi_tmp[i] = 1.0
         Psat[i], _, _ = calc_saturation_properties(
             T, xi_tmp, Eos, density_opts=density_opts, **kwargs
@@ -3611,23 +4552,30 @@ def calc_bubble_pressure(
         if np.isnan(Psat[i]):
             Psat[i] = Psat_set
             logger.warning(
-                "Component, {}, is above its critical point.".format(i + 1)
-                + " Psat is assumed to be {}.".format(Psat[i])
+                "Component, %s, is above its critical point. Psat is assumed to be %s.",
+                i + 1,
+                Psat[i],
             )
 
     # Estimate initial pressure
     if Pguess is None:
-        P = 1.0 / np.sum(xi / Psat)
+        P = 1.0 / np.dot(xi, np.reciprocal(Psat))
     else:
         P = Pguess
 
-    if "_yi_global" not in globals() or any(np.isnan(_yi_global)):
-        _yi_global = xi * Psat / P
-        _yi_global /= np.nansum(_yi_global)
-        _yi_global = copy.deepcopy(_yi_global)
-        logger.info(
-            "Guess yi in calc_bubble_pressure with Psat: " "{}".format(_yi_global)
-        )
+    if _yi_global is None or np.isnan(_yi_global).any():
+        previous = _recall_composition_guess("bubble", xi, Eos)
+        if previous is not None:
+            _yi_global = previous[1].copy()
+            logger.info(
+                "Guess yi in calc_bubble_pressure from previous solution at T=%s: %s",
+                previous[0],
+                _yi_global,
+            )
+        else:
+            _yi_global = xi * Psat * (1.0 / P)
+            _yi_global /= np.nansum(_yi_global)
+            logger.info("Guess yi in calc_bubble_pressure with Psat: %s", _yi_global)
     yi = _yi_global
 
     Prange, Pestimate = calc_Prange_xi(
@@ -3648,15 +4596,18 @@ def calc_bubble_pressure(
         if Pguess is not None:
             if Pguess > Prange[1] or Pguess < Prange[0]:
                 logger.warning(
-                    "Given guess in pressure, {}, is outside of ".format(Pguess)
-                    + "the identified pressure range, "
-                    + "{}. Using estimated pressure, {}.".format(Prange, Pestimate)
+                    "Given guess in pressure, %s, is outside of the identified "
+                    "pressure range, %s. Using estimated pressure, %s.",
+                    Pguess,
+                    Prange,
+                    Pestimate,
                 )
                 P = Pestimate
             else:
                 logger.warning(
-                    "Using given guess in pressure, {}, that".format(Pguess)
-                    + " is inside identified pressure range."
+                    "Using given guess in pressure, %s, that is inside identified "
+                    "pressure range.",
+                    Pguess,
                 )
                 P = Pguess
         else:
@@ -3670,17 +4621,12 @@ def calc_bubble_pressure(
             options=pressure_options,
         )
 
-    # find liquid density and fugacity
-    phil, rhol, flagl = calc_liquid_fugacity_coefficient(
-        P, T, xi, Eos, density_opts=density_opts
-    )
-    phiv, rhov, flagv = calc_vapor_fugacity_coefficient(
-        P, T, yi, Eos, density_opts=density_opts
-    )
     if "tol" in mole_fraction_options:
         if mole_fraction_options["tol"] > 1e-10:
             mole_fraction_options["tol"] = 1e-10
 
+    # The objective solves both phase densities already, so take the phase
+    # flags from there instead of repeating the density solves
     obj = objective_bubble_pressure(
         P,
         xi,
@@ -3689,13 +4635,18 @@ def calc_bubble_pressure(
         density_opts=density_opts,
         mole_fraction_options=mole_fraction_options,
     )
+    flagl, flagv = _phase_flags_global
 
     logger.info(
-        "Final Output: Obj {}, P {} Pa, flagv {}, yi {}".format(
-            obj, P, flagv, _yi_global
-        )
+        "Final Output: Obj %s, P %s Pa, flagv %s, yi %s",
+        obj,
+        P,
+        flagv,
+        _yi_global,
     )
 
+    _store_composition_guess("bubble", xi, Eos, T, _yi_global)
+
     return P, _yi_global, flagv, flagl, obj
 
 
@@ -3741,41 +4692,51 @@ def hildebrand_solubility(
     """
     if len(kwargs) > 0:
         logger.debug(
-            "'hildebrand_solubility' does not use the following keyword arguments: "
-            + "{}".format(", ".join(list(kwargs.keys())))
+            "'hildebrand_solubility' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     R = constants.Nav * constants.kb
     RT = T * R
 
     if gtb.isiterable(rhol):
-        logger.info("rhol should be a float, not {}".format(rhol))
+        logger.info("rhol should be a float, not %s", rhol)
 
-    # Find dZdT
-    vlist, Plist1 = pressure_vs_volume_arrays(
-        T - dT, xi, Eos, **density_opts, max_density=rhol
-    )
-    vlist2, Plist2 = pressure_vs_volume_arrays(
-        T + dT, xi, Eos, **density_opts, max_density=rhol
-    )
+    # Find dZdT. The density grid does not depend on the small temperature
+    # shifts, so build it once at T and evaluate the EOS directly at T +/- dT
+    # on the same grid; this also guarantees the central difference uses
+    # identical volumes
     vlist, Plist = pressure_vs_volume_arrays(
         T, xi, Eos, **density_opts, max_density=rhol
     )
-    if any(vlist != vlist2):
-        logger.error("Dependant variable vectors must be identical.")
-
-    int_tmp = (Plist2 - Plist1) / (2 * dT) / R - Plist / (RT)
-    integrand_list = gaussian_filter1d(int_tmp, sigma=0.1)
-
-    # Calculate U_res
-    integrand_spline = interpolate.InterpolatedUnivariateSpline(
-        vlist, integrand_list, ext=1
-    )
-    U_res = -RT * integrand_spline.integral(1 / rhol, vlist[-1])
+    rholist = np.reciprocal(vlist)
+    Plist1 = Eos.pressure(rholist, T - dT, xi)
+    Plist2 = Eos.pressure(rholist, T + dT, xi)
+
+    # Build the integrand in place, reusing the perturbed pressure array
+    # rather than allocating a temporary per operation
+    integrand_list = Plist2
+    integrand_list -= Plist1
+    integrand_list /= 2 * dT * R
+    integrand_list -= Plist / RT
+
+    # Calculate U_res with the trapezoid rule directly on the dense grid;
+    # building a spline just to integrate it costs far more than the
+    # quadrature is worth, and the spline was zero below the data range anyway
+    v_lower = 1.0 / rhol
+    if v_lower <= vlist[0]:
+        U_res = -RT * np.trapz(integrand_list, vlist)
+    else:
+        ind = vlist >= v_lower
+        v_seg = np.concatenate(([v_lower], vlist[ind]))
+        y_seg = np.concatenate(
+            ([np.interp(v_lower, vlist, integrand_list)], integrand_list[ind])
+        )
+        U_res = -RT * np.trapz(y_seg, v_seg)
 
     # Check if function converged before taking integral, if not, correct area
     if integrand_list[-1] > tol:
-        slope, yroot = np.polyfit(vlist[-4:], integrand_list[-4:], 1)
+        slope, yroot = _pressure_tail_line(vlist, integrand_list)
         xroot = -yroot / slope
         U_res += -RT * integrand_list[-1] * (xroot - vlist[-1]) / 2
 
@@ -3783,7 +4744,7 @@ def hildebrand_solubility(
         raise ValueError("The solubility parameter can not be imaginary")
     else:
         delta = np.sqrt(-(U_res) * rhol)
-        logger.info("When T={}, xi={}, delta={}".format(T, xi, delta))
+        logger.info("When T=%s, xi=%s, delta=%s", T, xi, delta)
 
     return delta
 
@@ -3854,9 +4815,8 @@ def calc_flash(
 
     if len(kwargs) > 0:
         logger.debug(
-            "'kwargs' does not use the following keyword arguments: {}".format(
-                ", ".join(list(kwargs.keys()))
-            )
+            "'kwargs' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     # Initialize Variables
@@ -3866,13 +4826,13 @@ def calc_flash(
             + "{} were given.".format(Eos.number_of_components)
         )
 
-    Psat, Ki0, xi, yi, phil, phiv = [
-        np.zeros(Eos.number_of_components) for _ in np.arange(6)
-    ]
+    # Rows of one contiguous allocation rather than six separate arrays
+    Psat, Ki0, xi, yi, phil, phiv = np.zeros((6, Eos.number_of_components))
 
     # Calculate Psat and Ki
+    xi_tmp = np.zeros_like(xi)
     for i in range(np.size(xi)):
-        xi_tmp = np.zeros_like(xi)
+        xi_tmp.fill(0.0)
         xi_tmp[i] = 1.0
         Psat[i], _, _ = calc_saturation_properties(
             T, xi_tmp, Eos, density_opts=density_opts, **kwargs
@@ -3880,8 +4840,9 @@ def calc_flash(
         if np.isnan(Psat[i]):
             Psat[i] = Psat_set
             logger.warning(
-                "Component, {}, is above its critical point.".format(i + 1)
-                + " Psat is assumed to be {}.".format(Psat[i])
+                "Component, %s, is above its critical point. Psat is assumed to be %s.",
+                i + 1,
+                Psat[i],
             )
         Ki0[i] = Psat[i] / P
 
@@ -3923,14 +4884,12 @@ def calc_flash(
         phiv, rhov, flagv = calc_vapor_fugacity_coefficient(
             P, T, yi, Eos, density_opts=density_opts
         )
-        logger.info("        xi: {}, phil: {}".format(xi, phil))
-        logger.info("        yi: {}, phiv: {}".format(yi, phiv))
+        logger.info("        xi: %s, phil: %s", xi, phil)
+        logger.info("        yi: %s, phiv: %s", yi, phiv)
         Kinew = phil / phiv
 
         err = np.sum(np.abs(Kinew - Ki))
-        logger.info(
-            "  Guess {} Ki: {}, New Ki: {}, Error: {}".format(i, Ki, Kinew, err)
-        )
+        logger.info("  Guess %s Ki: %s, New Ki: %s, Error: %s", i, Ki, Kinew, err)
 
         # Check Objective function
         Kiprev = Ki
@@ -3943,10 +4902,12 @@ def calc_flash(
             count_reset += 1
         if not (Kinew == Ki_tmp).all():
             logger.info(
-                "    Reset Ki values, {}, according to mole".format(Kinew)
-                + " fraction constraint, {} to {}, to produce {}".format(
-                    min_mole_fraction0, max_mole_fraction0, Ki_tmp
-                )
+                "    Reset Ki values, %s, according to mole fraction constraint, %s to "
+                "%s, to produce %s",
+                Kinew,
+                min_mole_fraction0,
+                max_mole_fraction0,
+                Ki_tmp,
             )
             Ki = Ki_tmp
             if count_reset == 10:
@@ -3954,11 +4915,13 @@ def calc_flash(
                 Ki[0] = Ki[1]
                 Ki[1] = tmp
             elif count_reset == 20:
-                ind = np.where(Kiprev == min(Kiprev[Kiprev > 0]))[0][0]
+                ind = np.argmin(np.where(Kiprev > 0, Kiprev, np.inf))
                 err = np.abs(Ki[ind] - Kiprev[ind]) / Kiprev[ind]
                 logger.warning(
-                    "    Reset Ki values more than {} times. Remaining ".format(20)
-                    + "error, {}. These constraints may not be feasible".format(err)
+                    "    Reset Ki values more than %s times. Remaining error, %s. "
+                    "These constraints may not be feasible",
+                    20,
+                    err,
                 )
                 break
         elif np.all(np.abs(Ki - 1.0) < 1e-6) and flag_critical < 2:
@@ -3972,13 +4935,13 @@ def calc_flash(
                 Ki[flag_critical] = eps
             flag_critical += 1
             logger.info(
-                "    Liquid and vapor mole fractions are equal, let search from Ki ="
-                + " {}".format(Ki)
+                "    Liquid and vapor mole fractions are equal, let search from Ki = %s",
+                Ki,
             )
         elif err < tol:
-            ind = np.where(Ki == min(Ki[Ki > 0]))[0][0]
+            ind = np.argmin(np.where(Ki > 0, Ki, np.inf))
             err = np.abs(Kinew[ind] - Ki[ind]) / Ki[ind]
-            logger.info("    Percent Error on smallest Ki value: {}".format(err))
+            logger.info("    Percent Error on smallest Ki value: %s", err)
             if err < tol:
                 logger.info("    Found Ki")
                 break
@@ -3987,12 +4950,12 @@ def calc_flash(
             Ki = Kinew
 
     if i == maxiter - 1:
-        ind = np.where(Kiprev == min(Kiprev[Kiprev > 0]))[0][0]
+        ind = np.argmin(np.where(Kiprev > 0, Kiprev, np.inf))
         err = np.abs(Ki[ind] - Kiprev[ind]) / Kiprev[ind]
         logger.warning(
-            "    More than {} iterations needed. Remaining error, {}.".format(
-                maxiter, err
-            )
+            "    More than %s iterations needed. Remaining error, %s.",
+            maxiter,
+            err,
         )
 
     # If needed, switch liquid and vapor mole fractions
@@ -4010,9 +4973,12 @@ def calc_flash(
         yi, flagv = zi, flag
 
     logger.info(
-        "Final Output: Obj {}, xi {} flagl {}, yi {} flagv {}".format(
-            err, xi, flagl, yi, flagv
-        )
+        "Final Output: Obj %s, xi %s flagl %s, yi %s flagv %s",
+        err,
+        xi,
+        flagl,
+        yi,
+        flagv,
     )
 
     return xi, flagl, yi, flagv, err
@@ -4048,9 +5014,8 @@ def constrain_Ki(Ki0, min_mole_fraction0=0, max_mole_fraction0=1, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "'constrain_Ki' does not use the following keyword arguments: {}".format(
-                ", ".join(list(kwargs.keys()))
-            )
+            "'constrain_Ki' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     Ki = Ki0.copy()
@@ -4126,8 +5091,8 @@ def constrain_Ki(Ki0, min_mole_fraction0=0, max_mole_fraction0=1, **kwargs):
     min0 = max(min_list)
 
     if np.any(Ki[1] > max_list) or np.any(Ki[1] < min_list):
-        logger.debug("    Constrain K1 to between {} and {}".format(min0, max0))
-        Ki[1] = (max0 - min0) * np.random.rand(1)[0] + min0
+        logger.debug("    Constrain K1 to between %s and %s", min0, max0)
+        Ki[1] = (max0 - min0) * random.random() + min0
         flag_reset = True
 
     x0 = (1 - Ki[1]) / (Ki[0] - Ki[1])
@@ -4247,8 +5212,8 @@ def fugacity_test_1(P, T, xi, rho, Eos, step_size=1e-5, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "'fugacity_test_1' does not use the following keyword arguments:"
-            + " {}".format(", ".join(list(kwargs.keys())))
+            "'fugacity_test_1' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     Z = P / (rho * T * constants.R)
@@ -4304,8 +5269,8 @@ def fugacity_test_2(P, T, xi, rho, Eos, step_size=1e-3, n0=1, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "'fugacity_test_2' does not use the following keyword arguments:"
-            + "{}".format(", ".join(list(kwargs.keys())))
+            "'fugacity_test_2' does not use the following keyword arguments:%s",
+            ", ".join(list(kwargs.keys())),
         )
 
     ncomp = len(xi)
@@ -4314,9 +5279,8 @@ def fugacity_test_2(P, T, xi, rho, Eos, step_size=1e-3, n0=1, **kwargs):
         logger.error("fugacity_test_2 is for multicomponent systems.")
     elif len(ind) != ncomp:
         logger.info(
-            "There is not a significant amount of components {} in solution".format(
-                np.setdiff1d(range(ncomp), ind)
-            )
+            "There is not a significant amount of components %s in solution",
+            np.setdiff1d(range(ncomp), ind),
         )
 
     dlnPhidrho = gtb.central_difference(
@@ -4378,8 +5342,8 @@ def activity_coefficient(P, T, xi, yi, Eos, **kwargs):
 
     if len(kwargs) > 0:
         logger.debug(
-            "'activity_coefficient' does not use the following keyword arguments: "
-            + "{}".format(", ".join(list(kwargs.keys())))
+            "'activity_coefficient' does not use the following keyword arguments: %s",
+            ", ".join(list(kwargs.keys())),
         )
 
     ncomp = len(xi)
@@ -60,7 +60,7 @@ setup(
     ext_modules=extensions,
     extras_require={
         "extra": ["cython"],
-        "tests": ["pytest"],
+        "tests": ["pytest", "pytest-xdist"],
     },
     install_requires=[
         "numpy",